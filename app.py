@@ -10,7 +10,7 @@ import sqlite3
 from urllib.parse import quote, unquote
 import traceback
 from functools import wraps
-from hash_cache import HashCache
+from hash_cache import HashCache, hash_file_sha256
 from runtime_paths import get_base_dir, get_config_file, get_static_dir
 
 def handle_db_corruption(f):
@@ -73,6 +73,7 @@ from library_cleanliness import (
     parse_metadata_datetime,
 )
 from library_sync import (
+    iter_visible_media_entries,
     synchronize_library_generator,
     count_media_files,
     count_media_files_by_type,
@@ -99,10 +100,15 @@ from media_finalization import (
     finalize_mutated_media,
     rollback_finalize_mutated_media,
 )
-from media_dates import write_and_verify_media_date
+from media_dates import (
+    format_canonical_media_date,
+    parse_canonical_media_date,
+    write_and_verify_media_date,
+)
 from library_filesystem import (
     ensure_blocking_audit_prep,
     iter_layout_cleanup_passes,
+    move_file,
     move_file_to_category_trash,
     quarantine_root_hidden,
     remove_noncanonical_trees,
@@ -117,6 +123,7 @@ from photo_canonicalization import (
     CanonicalizedPhoto,
     canonicalize_photo_file,
 )
+from photo_catalog import iter_rows_for_ids
 from picker_sort import sort_picker_items
 from make_library_perfect import _compute_photo_duplicate_key, verify_media_file
 from trash_catalog import (
@@ -125,6 +132,7 @@ from trash_catalog import (
     fetch_deleted_photos_anchored_at_month,
     fetch_deleted_photos_for_grid_month,
     fetch_deleted_photos_page,
+    fetch_deleted_rows_by_id,
     fetch_trash_nearest_month,
     fetch_trash_years,
     get_cached_trash_month_index,
@@ -165,6 +173,10 @@ BASE_DIR = get_base_dir()
 STATIC_DIR = get_static_dir()
 
 app = Flask(__name__, static_folder=STATIC_DIR, static_url_path='/static')
+# Grid responses carry the whole library; skip per-dict key sorting and the
+# debug-mode indentation when encoding them (the UI never relies on key order).
+app.json.sort_keys = False
+app.json.compact = True
 
 # Feature flags
 app.config['DRY_RUN_DATE_EDIT'] = False  # REAL UPDATES - using test library
@@ -197,12 +209,16 @@ error_logger.setLevel(logging.WARNING)
 
 def get_db_connection():
     """Create database connection with WAL mode enabled"""
+    # timeout=60 already installs SQLite's 60s busy handler on open.
     conn = sqlite3.connect(DB_PATH, timeout=60)
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
     
-    # Enable Write-Ahead Logging for better concurrency
+    # Enable Write-Ahead Logging for better concurrency. Re-asserted on every
+    # open: Clean switches the file to DELETE mode while it rebuilds.
     conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=60000")
+    # In WAL mode NORMAL only fsyncs at checkpoints; a crash can drop the last
+    # commits but never corrupts the file.
+    conn.execute("PRAGMA synchronous=NORMAL")
     
     # Enable foreign keys for data integrity
     conn.execute("PRAGMA foreign_keys=ON")
@@ -215,15 +231,17 @@ def get_image_dimensions(file_path):
         # Check if it's a video file
         ext = os.path.splitext(file_path)[1].lower()
         if ext in VIDEO_EXTENSIONS:
-            # Use ffprobe for videos
+            # Use ffprobe for videos: first video stream's size only, so it
+            # skips audio/data streams and full per-stream JSON.
             import subprocess
             import json
             
             cmd = [
                 'ffprobe',
                 '-v', 'quiet',
+                '-select_streams', 'v:0',
+                '-show_entries', 'stream=width,height',
                 '-print_format', 'json',
-                '-show_streams',
                 file_path
             ]
             
@@ -231,11 +249,10 @@ def get_image_dimensions(file_path):
             if result.returncode == 0:
                 data = json.loads(result.stdout)
                 for stream in data.get('streams', []):
-                    if stream.get('codec_type') == 'video':
-                        width = stream.get('width')
-                        height = stream.get('height')
-                        if width and height:
-                            return (width, height)
+                    width = stream.get('width')
+                    height = stream.get('height')
+                    if width and height:
+                        return (width, height)
         else:
             width, height = shared_get_dimensions(file_path)
             if width and height:
@@ -246,20 +263,12 @@ def get_image_dimensions(file_path):
 
 def compute_hash(file_path):
     """Compute SHA-256 hash of file"""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(1048576), b""):  # 1MB chunks for network efficiency
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()[:7]  # First 7 chars
+    return hash_file_sha256(file_path)[:7]  # First 7 chars
 
 
 def compute_full_hash(file_path):
     """Compute the full SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(1048576), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    return hash_file_sha256(file_path)
 
 def save_and_hash(file_storage, dest_path):
     """
@@ -516,7 +525,7 @@ def commit_staged_canonical_photo(
     if source_matches_target:
         os.replace(staged_path, target_path)
     else:
-        shutil.move(staged_path, target_path)
+        move_file(staged_path, target_path)
     staged_photo.staged_path = None
 
     try:
@@ -676,11 +685,10 @@ def update_photo_date_with_files(photo_id, new_date, conn):
         
         # Phase 0: Bake orientation (before EXIF write to preserve it)
         try:
-            print(f"  🔄 Checking orientation...")
             bake_success, bake_message, orient_value = bake_orientation(old_full_path)
             
             if bake_success:
-                print(f"  ✅ {bake_message}")
+                app.logger.debug(f"Photo {photo_id}: {bake_message}")
                 # Dimensions may have changed - will be updated later if needed
                 # Hash will change - will be detected after EXIF write
             else:
@@ -774,12 +782,9 @@ def generate_thumbnail_for_file(file_path, content_hash, file_type):
             return True
 
         if file_type == 'video':
-            os.makedirs(IMPORT_TEMP_DIR, exist_ok=True)
-            temp_frame = os.path.join(IMPORT_TEMP_DIR, f"temp_frame_{content_hash[:16]}.jpg")
             generate_video_square_thumbnail(
                 file_path,
                 thumbnail_path,
-                temp_frame_path=temp_frame,
                 to_rgb=convert_to_rgb_properly,
             )
             return True
@@ -864,8 +869,8 @@ def month_key_for_photo_grid(date_taken, current_path):
     """
     effective_date = effective_date_taken_for_edit(date_taken, current_path)
     if effective_date:
-        date_normalized = effective_date.replace(':', '-', 2)
-        return date_normalized[:7]
+        # Slice first: the first two colons of the prefix are the string's.
+        return effective_date[:7].replace(':', '-', 2)
     return 'undated'
 
 
@@ -905,6 +910,8 @@ PHOTO_TOTAL_COUNT_CACHE = None
 PHOTO_TOTAL_COUNT_CACHE_REVISION = None
 MONTH_INDEX_CACHE = {}
 MONTH_INDEX_CACHE_REVISION = None
+PHOTO_YEARS_CACHE = None
+PHOTO_YEARS_CACHE_REVISION = None
 
 
 def get_library_catalog_revision():
@@ -931,6 +938,7 @@ def invalidate_grid_read_caches():
     """Drop cached month histogram and total count after row/histogram mutations."""
     invalidate_photo_total_count_cache()
     invalidate_month_index_cache()
+    invalidate_photo_years_cache()
     invalidate_trash_grid_caches()
 
 
@@ -941,6 +949,17 @@ def commit_row_mutation(conn, *, invalidate_histogram=True):
         invalidate_grid_read_caches()
 
 
+def begin_write_transaction(conn):
+    """
+    Take the SQLite write lock up front for a multi-row batch.
+
+    Batches that move files before touching rows should fail before the first
+    move rather than on a mid-batch lock upgrade.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+
 def invalidate_photo_total_count_cache():
     """Drop cached library row count for the current catalog revision."""
     global PHOTO_TOTAL_COUNT_CACHE, PHOTO_TOTAL_COUNT_CACHE_REVISION
@@ -954,6 +973,13 @@ def invalidate_month_index_cache():
     MONTH_INDEX_CACHE = {}
 
 
+def invalidate_photo_years_cache():
+    """Drop cached year picker list for the current catalog revision."""
+    global PHOTO_YEARS_CACHE, PHOTO_YEARS_CACHE_REVISION
+    PHOTO_YEARS_CACHE = None
+    PHOTO_YEARS_CACHE_REVISION = None
+
+
 def notify_catalog_reset_from_make_perfect(result):
     """Bump catalog revision after a successful make-perfect (Clean) run."""
     if result and result.get('status') == 'SUCCESS':
@@ -1008,6 +1034,24 @@ def get_photo_total_count(cursor):
     return PHOTO_TOTAL_COUNT_CACHE
 
 
+def get_cached_photo_years(cursor):
+    """Return sorted years that have dated photos; cached per catalog revision."""
+    global PHOTO_YEARS_CACHE, PHOTO_YEARS_CACHE_REVISION
+    if PHOTO_YEARS_CACHE is None or PHOTO_YEARS_CACHE_REVISION != LIBRARY_CATALOG_REVISION:
+        rows = cursor.execute("""
+            SELECT DISTINCT substr(date_taken, 1, 4) as year
+            FROM photos
+            WHERE date_taken IS NOT NULL
+            ORDER BY year ASC
+        """).fetchall()
+        PHOTO_YEARS_CACHE = sort_picker_items(
+            [int(row['year']) for row in rows],
+            key=str,
+        )
+        PHOTO_YEARS_CACHE_REVISION = LIBRARY_CATALOG_REVISION
+    return PHOTO_YEARS_CACHE
+
+
 def normalize_month_for_sql(month_str):
     """Map UI month YYYY-MM to DB substr(date_taken,1,7) form YYYY:MM."""
     if not month_str or len(month_str) < 7:
@@ -1122,12 +1166,14 @@ def _hydrate_photo_rows_by_id(cursor, id_rows):
     if not id_rows:
         return []
     ids = [row['id'] if hasattr(row, 'keys') else row[0] for row in id_rows]
-    placeholders = ','.join('?' * len(ids))
-    rows = cursor.execute(
-        f"{PHOTO_GRID_SELECT} WHERE id IN ({placeholders})",
-        ids,
-    ).fetchall()
-    by_id = {row['id']: row for row in rows}
+    by_id = {
+        row['id']: row
+        for row in iter_rows_for_ids(
+            cursor,
+            PHOTO_GRID_SELECT + " WHERE id IN ({placeholders})",
+            ids,
+        )
+    }
     return [by_id[photo_id] for photo_id in ids if photo_id in by_id]
 
 
@@ -1327,11 +1373,65 @@ def _fetch_undated_photo_page(cursor, limit, after=None):
     return _hydrate_photo_rows_by_id(cursor, id_rows)
 
 
+def _grid_dicts_from_tuples(rows):
+    """
+    Serialize plain PHOTO_GRID_SELECT tuples for the grid API.
+
+    Same output as photo_row_to_grid_dict; real EXIF dates take the month
+    straight from the string instead of going through path inference.
+    """
+    photos = []
+    append = photos.append
+    for photo_id, date_taken, date_added, file_type, current_path, width, height, rating in rows:
+        if isinstance(date_taken, str) and date_taken and not date_taken.startswith('1900:01:01'):
+            month = date_taken[:7].replace(':', '-', 2)
+        else:
+            month = month_key_for_photo_grid(date_taken, current_path)
+        append({
+            'id': photo_id,
+            'date': date_taken,
+            'date_added': date_added,
+            'month': month,
+            'file_type': file_type,
+            'path': current_path,
+            'width': width,
+            'height': height,
+            'rating': rating,
+        })
+    return photos
+
+
+def _select_grid_dicts(cursor, sql, params=()):
+    """Stream a grid query through a tuple cursor (no sqlite3.Row per row)."""
+    plain = cursor.connection.cursor()
+    plain.row_factory = None
+    try:
+        return _grid_dicts_from_tuples(plain.execute(sql, params))
+    finally:
+        plain.close()
+
+
 def fetch_all_photos_for_grid(cursor, sort_order):
-    """Return full library in grid order without a global sort temp table."""
-    dated_rows = _fetch_dated_photo_page(cursor, limit=10**9, sort_order=sort_order)
-    undated_rows = _fetch_undated_photo_page(cursor, limit=10**9)
-    return list(dated_rows) + list(undated_rows)
+    """
+    Return the full library as grid dicts, dated rows first.
+
+    One ordered query per section walks idx_grid_newest / idx_grid_oldest /
+    idx_undated_path directly; no id round-trip and no sort temp table.
+    """
+    direction = 'DESC' if sort_order == 'newest' else 'ASC'
+    photos = _select_grid_dicts(
+        cursor,
+        f"""{PHOTO_GRID_SELECT}
+        WHERE date_taken IS NOT NULL
+        ORDER BY date_taken {direction}, current_path ASC, id ASC""",
+    )
+    photos.extend(_select_grid_dicts(
+        cursor,
+        f"""{PHOTO_GRID_SELECT}
+        WHERE date_taken IS NULL
+        ORDER BY current_path ASC, id ASC""",
+    ))
+    return photos
 
 
 def fetch_photos_page(cursor, limit, sort_order, cursor_str=None):
@@ -1503,8 +1603,7 @@ def get_photos():
             return jsonify(attach_catalog_revision(payload))
 
         if limit is None:
-            rows = fetch_all_photos_for_grid(cursor, sort_order)
-            photos = [photo_row_to_grid_dict(row) for row in rows]
+            photos = fetch_all_photos_for_grid(cursor, sort_order)
             conn.close()
             return jsonify(attach_catalog_revision({'photos': photos, 'count': len(photos)}))
 
@@ -1898,22 +1997,40 @@ def get_photos_for_month():
 @app.route('/api/photo/<int:photo_id>/dimensions')
 @handle_db_corruption
 def get_photo_dimensions(photo_id):
-    """Get dimensions for a specific photo"""
+    """Get dimensions for a specific photo (catalog first, file on a miss)"""
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Get photo path
-        cursor.execute("SELECT current_path FROM photos WHERE id = ?", (photo_id,))
+        cursor.execute(
+            "SELECT current_path, width, height FROM photos WHERE id = ?",
+            (photo_id,),
+        )
         row = cursor.fetchone()
-        conn.close()
         
         if not row:
+            conn.close()
             return jsonify({'error': 'Photo not found'}), 404
         
-        # Get dimensions from file
+        if row['width'] and row['height']:
+            conn.close()
+            return jsonify({
+                'id': photo_id,
+                'width': row['width'],
+                'height': row['height']
+            })
+        
+        # Not recorded at import: read the file and backfill the row
         full_path = os.path.join(LIBRARY_PATH, row['current_path'])
         dimensions = get_image_dimensions(full_path)
+        if dimensions:
+            begin_write_transaction(conn)
+            cursor.execute(
+                "UPDATE photos SET width = ?, height = ? WHERE id = ?",
+                (dimensions[0], dimensions[1], photo_id),
+            )
+            commit_row_mutation(conn)
+        conn.close()
         
         if dimensions:
             return jsonify({
@@ -1927,6 +2044,19 @@ def get_photo_dimensions(photo_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def send_cached_thumbnail(thumbnail_path):
+    """
+    send_file a cached thumbnail, or return None when it is not on disk yet.
+
+    send_file stats the path itself, so probing with os.path.exists first
+    would cost a second stat on every cache hit.
+    """
+    try:
+        return send_file(thumbnail_path, mimetype='image/jpeg')
+    except FileNotFoundError:
+        return None
+
+
 @app.route('/api/photo/<int:photo_id>/thumbnail')
 @handle_db_corruption
 def get_photo_thumbnail(photo_id):
@@ -1963,8 +2093,9 @@ def get_photo_thumbnail(photo_id):
         thumbnail_path = thumbnail_cache_path(THUMBNAIL_CACHE_DIR, content_hash)
 
         # Serve cached thumbnail if it exists
-        if os.path.exists(thumbnail_path):
-            return send_file(thumbnail_path, mimetype='image/jpeg')
+        cached = send_cached_thumbnail(thumbnail_path)
+        if cached is not None:
+            return cached
 
         full_path = os.path.join(LIBRARY_PATH, relative_path)
 
@@ -1974,12 +2105,10 @@ def get_photo_thumbnail(photo_id):
         thumbnail_path = thumbnail_cache_path(THUMBNAIL_CACHE_DIR, content_hash, mkdir=True)
 
         if row['file_type'] == 'video':
-            temp_frame = os.path.join(os.path.dirname(thumbnail_path), f"temp_{photo_id}.jpg")
             try:
                 generate_video_square_thumbnail(
                     full_path,
                     thumbnail_path,
-                    temp_frame_path=temp_frame,
                     to_rgb=convert_to_rgb_properly,
                 )
             except Exception as video_error:
@@ -2341,34 +2470,33 @@ def cleanup_empty_folders(file_path, library_root):
             if not os.path.exists(current_dir):
                 break
             
-            # Check if any media files exist
-            entries = os.listdir(current_dir)
+            # Check if any media files exist (scandir: type comes from the
+            # directory entry, no stat per child)
             has_media = False
             
-            for entry in entries:
-                entry_path = os.path.join(current_dir, entry)
-                
-                # Skip hidden files/dirs
-                if entry.startswith('.'):
-                    continue
-                    
-                # If has subdirectories, keep it (process bottom-up)
-                if os.path.isdir(entry_path):
-                    has_media = True
-                    break
-                
-                # Check if it's a media file
-                if os.path.isfile(entry_path):
-                    ext = os.path.splitext(entry)[1].lower()
-                    if ext in MEDIA_EXTS:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    # Skip hidden files/dirs
+                    if entry.name.startswith('.'):
+                        continue
+                        
+                    # If has subdirectories, keep it (process bottom-up)
+                    if entry.is_dir():
                         has_media = True
                         break
+                    
+                    # Check if it's a media file
+                    if entry.is_file():
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in MEDIA_EXTS:
+                            has_media = True
+                            break
             
             # If no media (only non-media files or empty), DELETE IT ALL
             if not has_media:
                 shutil.rmtree(current_dir)
                 rel_path = os.path.relpath(current_dir, library_root)
-                print(f"    ✓ Deleted empty folder: {rel_path}")
+                app.logger.debug(f"Deleted empty folder: {rel_path}")
                 
                 # Move up to parent and continue
                 current_dir = os.path.dirname(current_dir)
@@ -2396,39 +2524,27 @@ def cleanup_empty_thumbnail_folders(thumbnail_path):
         shard2_dir = os.path.dirname(thumbnail_path)  # .thumbnails/ab/cd/
         shard1_dir = os.path.dirname(shard2_dir)      # .thumbnails/ab/
         
-        # Try removing level-2 shard (cd/)
-        if os.path.exists(shard2_dir):
+        # rmdir only succeeds on an empty folder, so try it directly instead
+        # of listing shards that may hold hundreds of entries.
+        for shard_dir in (shard2_dir, shard1_dir):
             try:
-                # Check if empty (no files, no subdirs)
-                if len(os.listdir(shard2_dir)) == 0:
-                    os.rmdir(shard2_dir)
-                    print(f"    ✓ Cleaned up empty thumbnail shard: {os.path.basename(shard2_dir)}/")
+                os.rmdir(shard_dir)
+            except FileNotFoundError:
+                continue  # Already gone; the parent shard may still be empty
             except OSError:
-                pass  # Not empty or permission issue, ignore
-        
-        # Try removing level-1 shard (ab/)
-        if os.path.exists(shard1_dir):
-            try:
-                if len(os.listdir(shard1_dir)) == 0:
-                    os.rmdir(shard1_dir)
-                    print(f"    ✓ Cleaned up empty thumbnail shard: {os.path.basename(shard1_dir)}/")
-            except OSError:
-                pass  # Not empty or permission issue, ignore
+                break  # Not empty or permission issue: parent can't be empty either
+            app.logger.debug(f"Cleaned up empty thumbnail shard: {os.path.basename(shard_dir)}/")
                 
     except Exception as e:
         # Never fail the operation if cleanup fails
         print(f"    ⚠️  Thumbnail folder cleanup failed: {e}")
 
-def _delete_photo_id(cursor, photo_id, trash_dir):
-    """Move one library photo to user trash and archive its DB row."""
+def _delete_photo_id(cursor, photo_id, row, trash_dir):
+    """Move one library photo to user trash and archive its prefetched DB row."""
     moved_to_trash = None
     original_full_path = None
     merge_duplicate = False
     try:
-        print(f"    Processing photo_id: {photo_id}", flush=True)
-        cursor.execute("SELECT * FROM photos WHERE id = ?", (photo_id,))
-        row = cursor.fetchone()
-
         if not row:
             print(f"    ❌ Photo {photo_id} NOT FOUND in database")
             return False, f"Photo {photo_id} not found"
@@ -2437,8 +2553,6 @@ def _delete_photo_id(cursor, photo_id, trash_dir):
         current_path = photo_data['current_path']
         original_full_path = os.path.join(LIBRARY_PATH, current_path)
 
-        print(f"  - Photo {photo_id}: {current_path}")
-
         deleted_at = datetime.now().isoformat()
         outcome, trash_filename, error = archive_live_photo_to_user_trash(
             cursor,
@@ -2455,14 +2569,13 @@ def _delete_photo_id(cursor, photo_id, trash_dir):
 
         if outcome == 'merged_duplicate':
             merge_duplicate = True
-            print(
-                f"    ✓ Merged with existing trash copy (hash "
-                f"{photo_data.get('content_hash', '')[:8]})",
-                flush=True,
+            app.logger.debug(
+                f"Merged photo {photo_id} with existing trash copy (hash "
+                f"{photo_data.get('content_hash', '')[:8]})"
             )
         else:
             moved_to_trash = resolve_user_deleted_trash_path(trash_dir, trash_filename)
-            print(f"    ✓ Moved to: {moved_to_trash}", flush=True)
+            app.logger.debug(f"Moved photo {photo_id} to: {moved_to_trash}")
 
         cleanup_empty_folders(original_full_path, LIBRARY_PATH)
 
@@ -2472,7 +2585,6 @@ def _delete_photo_id(cursor, photo_id, trash_dir):
             if os.path.exists(thumbnail_path):
                 os.remove(thumbnail_path)
                 cleanup_empty_thumbnail_folders(thumbnail_path)
-                print(f"    ✓ Deleted thumbnail")
 
         app.logger.info(f"Deleted photo {photo_id}: {current_path}")
         return True, None
@@ -2533,8 +2645,20 @@ def delete_photos():
         
         print(f"    Starting delete loop for {len(photo_ids)} photos...", flush=True)
         
+        begin_write_transaction(conn)
+        rows_by_id = {
+            row['id']: row
+            for row in iter_rows_for_ids(
+                cursor,
+                "SELECT * FROM photos WHERE id IN ({placeholders})",
+                photo_ids,
+            )
+        }
         for photo_id in photo_ids:
-            deleted, error = _delete_photo_id(cursor, photo_id, trash_dir)
+            # pop: a repeated id is "not found" the second time, as before.
+            deleted, error = _delete_photo_id(
+                cursor, photo_id, rows_by_id.pop(photo_id, None), trash_dir,
+            )
             if deleted:
                 deleted_count += 1
             elif error:
@@ -2699,6 +2823,89 @@ def update_photo_date():
         app.logger.error(f"Error updating photo date: {e}")
         return jsonify({'error': str(e)}), 500
 
+
+def load_photo_edit_dates(cursor, photo_ids):
+    """
+    Load effective dates for a bulk date edit, in photo_ids order.
+
+    Returns ([(photo_id, date_str), ...], None), or (None, photo_id) for the
+    first photo with no usable date. Ids missing from the catalog are skipped.
+    """
+    ids = list(photo_ids)
+    rows_by_id = {
+        row['id']: row
+        for row in iter_rows_for_ids(
+            cursor,
+            "SELECT id, date_taken, current_path FROM photos WHERE id IN ({placeholders})",
+            ids,
+        )
+    }
+
+    photo_dates = []
+    for photo_id in ids:
+        row = rows_by_id.get(photo_id)
+        if row is None:
+            continue
+        date_str = effective_date_taken_for_edit(row['date_taken'], row['current_path'])
+        if not date_str:
+            return None, photo_id
+        photo_dates.append((photo_id, date_str))
+    return photo_dates, None
+
+
+def order_photo_ids_by_edit_date(cursor, photo_ids):
+    """
+    Order photo ids by their effective date for a sequence edit.
+
+    Returns (ordered_ids, None), or (None, photo_id) for the first photo with no
+    usable date. Ids missing from the catalog are skipped.
+    """
+    photo_dates, undated_id = load_photo_edit_dates(cursor, photo_ids)
+    if undated_id is not None:
+        return None, undated_id
+    # YYYY:MM:DD HH:MM:SS is fixed-width, so string order is chronological order.
+    photo_dates.sort(key=lambda item: item[1])
+    return [photo_id for photo_id, _ in photo_dates], None
+
+
+def shift_photo_dates(photo_dates, offset):
+    """Map (photo_id, date_str) pairs to their dates moved by a timedelta offset."""
+    return {
+        photo_id: format_canonical_media_date(parse_canonical_media_date(date_str) + offset)
+        for photo_id, date_str in photo_dates
+    }
+
+
+def plan_shift_photo_dates(cursor, photo_ids, new_date):
+    """
+    Target dates for a shift edit: every photo moves by the first photo's offset.
+
+    One load_photo_edit_dates pass supplies the first photo's date as well as
+    the rest. Returns (photo_date_map, None), or (None, (message, status)).
+    """
+    photo_dates, undated_id = load_photo_edit_dates(cursor, photo_ids)
+    if undated_id is not None:
+        if undated_id == photo_ids[0]:
+            return None, ('First photo has no usable date to shift from', 400)
+        return None, (f'Photo {undated_id} has no usable date to shift from', 400)
+    if not photo_dates or photo_dates[0][0] != photo_ids[0]:
+        return None, ('First photo not found', 404)
+
+    offset = parse_canonical_media_date(new_date) - parse_canonical_media_date(photo_dates[0][1])
+    return shift_photo_dates(photo_dates, offset), None
+
+
+def sequence_photo_dates(ordered_photo_ids, base_date_str, interval):
+    """Map photo ids to base_date_str + index * interval as EXIF date strings."""
+    # datetime arithmetic, not epoch seconds: time.gmtime() rejects pre-1970
+    # timestamps on Windows.
+    base_date = parse_canonical_media_date(base_date_str)
+    return {
+        photo_id: format_canonical_media_date(base_date + interval * index)
+        for index, photo_id in enumerate(ordered_photo_ids)
+    }
+
+
 @app.route('/api/photos/bulk_update_date', methods=['POST'])
 @handle_db_corruption
 def bulk_update_photo_dates():
@@ -2731,44 +2938,11 @@ def bulk_update_photo_dates():
         
         elif mode == 'shift':
             # Shift all photos by the offset from the first photo
-            cursor.execute(
-                "SELECT date_taken, current_path FROM photos WHERE id = ?",
-                (photo_ids[0],),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return jsonify({'error': 'First photo not found'}), 404
-
-            original_date_str = effective_date_taken_for_edit(
-                row['date_taken'],
-                row['current_path'],
-            )
-            if not original_date_str:
-                return jsonify({'error': 'First photo has no usable date to shift from'}), 400
-
-            original_date = datetime.strptime(original_date_str, '%Y:%m:%d %H:%M:%S')
-            new_date_obj = datetime.strptime(new_date, '%Y:%m:%d %H:%M:%S')
-            offset = new_date_obj - original_date
-
-            # Calculate shifted date for each photo
-            for photo_id in photo_ids:
-                cursor.execute(
-                    "SELECT date_taken, current_path FROM photos WHERE id = ?",
-                    (photo_id,),
-                )
-                row = cursor.fetchone()
-                if row:
-                    photo_date_str = effective_date_taken_for_edit(
-                        row['date_taken'],
-                        row['current_path'],
-                    )
-                    if not photo_date_str:
-                        return jsonify({
-                            'error': f'Photo {photo_id} has no usable date to shift from',
-                        }), 400
-                    photo_date = datetime.strptime(photo_date_str, '%Y:%m:%d %H:%M:%S')
-                    shifted_date = photo_date + offset
-                    photo_date_map[photo_id] = shifted_date.strftime('%Y:%m:%d %H:%M:%S')
+            shifted, shift_error = plan_shift_photo_dates(cursor, photo_ids, new_date)
+            if shift_error is not None:
+                message, status = shift_error
+                return jsonify({'error': message}), status
+            photo_date_map.update(shifted)
         
         elif mode == 'sequence':
             # Sequence photos with interval
@@ -2785,36 +2959,15 @@ def bulk_update_photo_dates():
             else:
                 return jsonify({'error': 'Invalid interval unit'}), 400
             
-            # Get all photos with their original dates
-            photo_dates = []
-            for photo_id in photo_ids:
-                cursor.execute(
-                    "SELECT date_taken, current_path FROM photos WHERE id = ?",
-                    (photo_id,),
-                )
-                row = cursor.fetchone()
-                if row:
-                    photo_date_str = effective_date_taken_for_edit(
-                        row['date_taken'],
-                        row['current_path'],
-                    )
-                    if not photo_date_str:
-                        return jsonify({
-                            'error': f'Photo {photo_id} has no usable date to sequence from',
-                        }), 400
-                    original_date = datetime.strptime(photo_date_str, '%Y:%m:%d %H:%M:%S')
-                    photo_dates.append((photo_id, original_date))
-            
-            # Sort by original date
-            photo_dates.sort(key=lambda x: x[1])
-            
-            # Apply sequence
-            base_date = datetime.strptime(new_date, '%Y:%m:%d %H:%M:%S')
-            for index, (photo_id, _) in enumerate(photo_dates):
-                sequenced_date = base_date + (interval * index)
-                photo_date_map[photo_id] = sequenced_date.strftime('%Y:%m:%d %H:%M:%S')
+            ordered_ids, undated_id = order_photo_ids_by_edit_date(cursor, photo_ids)
+            if undated_id is not None:
+                return jsonify({
+                    'error': f'Photo {undated_id} has no usable date to sequence from',
+                }), 400
+            photo_date_map.update(sequence_photo_dates(ordered_ids, new_date, interval))
         
         # Now process all photos with file operations
+        begin_write_transaction(conn)
         master_transaction = DateEditTransaction()
         success_count = 0
         duplicate_count = 0
@@ -2968,45 +3121,11 @@ def bulk_update_photo_dates_execute():
             
             elif mode == 'shift':
                 # Shift all photos by the offset from the first photo
-                cursor.execute(
-                    "SELECT date_taken, current_path FROM photos WHERE id = ?",
-                    (photo_ids[0],),
-                )
-                row = cursor.fetchone()
-                if not row:
-                    yield f"event: error\ndata: {json.dumps({'error': 'First photo not found'})}\n\n"
+                shifted, shift_error = plan_shift_photo_dates(cursor, photo_ids, new_date)
+                if shift_error is not None:
+                    yield f"event: error\ndata: {json.dumps({'error': shift_error[0]})}\n\n"
                     return
-
-                original_date_str = effective_date_taken_for_edit(
-                    row['date_taken'],
-                    row['current_path'],
-                )
-                if not original_date_str:
-                    yield f"event: error\ndata: {json.dumps({'error': 'First photo has no usable date to shift from'})}\n\n"
-                    return
-
-                original_date = datetime.strptime(original_date_str, '%Y:%m:%d %H:%M:%S')
-                new_date_obj = datetime.strptime(new_date, '%Y:%m:%d %H:%M:%S')
-                offset = new_date_obj - original_date
-
-                # Calculate shifted date for each photo
-                for photo_id in photo_ids:
-                    cursor.execute(
-                        "SELECT date_taken, current_path FROM photos WHERE id = ?",
-                        (photo_id,),
-                    )
-                    row = cursor.fetchone()
-                    if row:
-                        photo_date_str = effective_date_taken_for_edit(
-                            row['date_taken'],
-                            row['current_path'],
-                        )
-                        if not photo_date_str:
-                            yield f"event: error\ndata: {json.dumps({'error': f'Photo {photo_id} has no usable date to shift from'})}\n\n"
-                            return
-                        photo_date = datetime.strptime(photo_date_str, '%Y:%m:%d %H:%M:%S')
-                        shifted_date = photo_date + offset
-                        photo_date_map[photo_id] = shifted_date.strftime('%Y:%m:%d %H:%M:%S')
+                photo_date_map.update(shifted)
             
             elif mode == 'sequence':
                 # Sequence photos with interval
@@ -3024,52 +3143,26 @@ def bulk_update_photo_dates_execute():
                     yield f"event: error\ndata: {json.dumps({'error': 'Invalid interval unit'})}\n\n"
                     return
                 
-                # Get all photos with their original dates
-                photo_dates = []
-                for photo_id in photo_ids:
-                    cursor.execute(
-                        "SELECT date_taken, current_path FROM photos WHERE id = ?",
-                        (photo_id,),
-                    )
-                    row = cursor.fetchone()
-                    if row:
-                        photo_date_str = effective_date_taken_for_edit(
-                            row['date_taken'],
-                            row['current_path'],
-                        )
-                        if not photo_date_str:
-                            yield f"event: error\ndata: {json.dumps({'error': f'Photo {photo_id} has no usable date to sequence from'})}\n\n"
-                            return
-                        original_date = datetime.strptime(photo_date_str, '%Y:%m:%d %H:%M:%S')
-                        photo_dates.append((photo_id, original_date))
-                
-                # Sort by original date
-                photo_dates.sort(key=lambda x: x[1])
-                
-                # Apply sequence
-                base_date = datetime.strptime(new_date, '%Y:%m:%d %H:%M:%S')
-                for index, (photo_id, _) in enumerate(photo_dates):
-                    sequenced_date = base_date + (interval * index)
-                    photo_date_map[photo_id] = sequenced_date.strftime('%Y:%m:%d %H:%M:%S')
+                ordered_ids, undated_id = order_photo_ids_by_edit_date(cursor, photo_ids)
+                if undated_id is not None:
+                    yield f"event: error\ndata: {json.dumps({'error': f'Photo {undated_id} has no usable date to sequence from'})}\n\n"
+                    return
+                photo_date_map.update(sequence_photo_dates(ordered_ids, new_date, interval))
             
             # Now process all photos with file operations and stream progress
+            begin_write_transaction(conn)
             master_transaction = DateEditTransaction()
             success_count = 0
             duplicate_count = 0
             total = len(photo_date_map)
             
-            print(f"🔍 DEBUG: photo_date_map has {total} entries")
-            print(f"🔍 DEBUG: photo_date_map keys type: {type(list(photo_date_map.keys())[0]) if photo_date_map else 'empty'}")
-            
             for idx, (photo_id, target_date) in enumerate(photo_date_map.items(), 1):
-                print(f"🔍 Processing photo_id: {photo_id} (type: {type(photo_id)}), target_date: {target_date}")
-                
                 success, result, transaction = update_photo_date_with_files(photo_id, target_date, conn)
                 
                 if success:
                     if result['status'] == 'duplicate_removed':
                         duplicate_count += 1
-                        print(f"  ⏭️  Photo {photo_id} is now a duplicate (moved to trash)")
+                        app.logger.debug(f"Photo {photo_id} is now a duplicate (moved to trash)")
                         yield f"event: progress\ndata: {json.dumps({'current': idx, 'total': total, 'photo_id': photo_id, 'duplicate_removed': True})}\n\n"
                     else:
                         success_count += 1
@@ -3147,17 +3240,28 @@ def _restore_photo_ids(cursor, photo_ids, trash_dir):
     processed_ids = []
     merged_ids = []
     errors = []
+    deleted_rows = fetch_deleted_rows_by_id(cursor, photo_ids)
 
     for photo_id in photo_ids:
         try:
-            print(f"  - Photo {photo_id}")
+            deleted_row = deleted_rows.pop(photo_id, None)
+            if deleted_row is None:
+                error = f'Photo {photo_id} not found in trash'
+                print(f"    ❌ {error}")
+                errors.append(error)
+                continue
+            begin_write_transaction(cursor.connection)
             outcome, live_photo_id, error = restore_or_merge_deleted_photo(
                 cursor,
                 photo_id=photo_id,
                 trash_dir=trash_dir,
                 library_path=LIBRARY_PATH,
+                deleted_row=deleted_row,
             )
             if outcome == 'error':
+                # Don't leave the empty BEGIN IMMEDIATE holding the write lock.
+                if cursor.connection.in_transaction:
+                    cursor.connection.rollback()
                 print(f"    ❌ {error}")
                 errors.append(error)
                 continue
@@ -3167,18 +3271,15 @@ def _restore_photo_ids(cursor, photo_ids, trash_dir):
             if outcome == 'merged':
                 merged_count += 1
                 merged_ids.append(photo_id)
-                print(
-                    f"    ✓ Merged with live photo {live_photo_id}",
-                    flush=True,
-                )
                 app.logger.info(
                     f"Merged trash photo {photo_id} with live photo {live_photo_id}",
                 )
             else:
-                print(f"    ✓ Restored photo {photo_id}", flush=True)
                 app.logger.info(f"Restored photo {photo_id}")
 
         except Exception as e:
+            if cursor.connection.in_transaction:
+                cursor.connection.rollback()
             errors.append(f"Error restoring photo {photo_id}: {str(e)}")
             print(f"    ❌ Error: {e}")
             error_logger.error(f"Restore failed for photo {photo_id}: {e}")
@@ -3450,8 +3551,9 @@ def get_trash_photo_thumbnail(photo_id):
             return jsonify({'error': 'Photo missing content hash'}), 404
 
         thumbnail_path = thumbnail_cache_path(THUMBNAIL_CACHE_DIR, content_hash)
-        if os.path.exists(thumbnail_path):
-            return send_file(thumbnail_path, mimetype='image/jpeg')
+        cached = send_cached_thumbnail(thumbnail_path)
+        if cached is not None:
+            return cached
 
         full_path = _deleted_media_full_path(TRASH_DIR, deleted_row)
         if not full_path:
@@ -3459,12 +3561,10 @@ def get_trash_photo_thumbnail(photo_id):
 
         thumbnail_path = thumbnail_cache_path(THUMBNAIL_CACHE_DIR, content_hash, mkdir=True)
         if file_type == 'video':
-            temp_frame = os.path.join(os.path.dirname(thumbnail_path), f"temp_trash_{photo_id}.jpg")
             try:
                 generate_video_square_thumbnail(
                     full_path,
                     thumbnail_path,
-                    temp_frame_path=temp_frame,
                     to_rgb=convert_to_rgb_properly,
                 )
             except Exception as video_error:
@@ -3531,10 +3631,11 @@ def purge_trash_photos():
             conn.close()
             return jsonify({'purged': 0, 'total': 0})
 
-        purged_count = 0
+        purged_ids = []
         errors = []
         trash_dir = TRASH_DIR
 
+        begin_write_transaction(conn)
         for photo_id in photo_ids:
             try:
                 deleted_row = _fetch_deleted_row(cursor, photo_id)
@@ -3547,11 +3648,17 @@ def purge_trash_photos():
                 )
                 if os.path.exists(trash_path):
                     os.remove(trash_path)
-                cursor.execute("DELETE FROM deleted_photos WHERE id = ?", (photo_id,))
-                purged_count += 1
+                purged_ids.append(photo_id)
             except Exception as exc:
                 errors.append(f"Error purging photo {photo_id}: {exc}")
 
+        # Drop all purged rows with one prepared statement instead of one per file.
+        cursor.executemany(
+            "DELETE FROM deleted_photos WHERE id = ?",
+            [(photo_id,) for photo_id in purged_ids],
+        )
+        purged_count = len(purged_ids)
+
         if purged_count > 0:
             commit_row_mutation(conn)
         else:
@@ -3608,21 +3715,7 @@ def get_years():
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        # Extract year from date_taken
-        cursor.execute("""
-            SELECT DISTINCT substr(date_taken, 1, 4) as year
-            FROM photos
-            WHERE date_taken IS NOT NULL
-            ORDER BY year ASC
-        """)
-        
-        rows = cursor.fetchall()
-        years = sort_picker_items(
-            [int(row['year']) for row in rows],
-            key=str,
-        )
-        
+        years = list(get_cached_photo_years(cursor))
         conn.close()
         
         return jsonify({'years': years})
@@ -3631,6 +3724,57 @@ def get_years():
         app.logger.error(f"Error fetching years: {e}")
         return jsonify({'error': str(e)}), 500
 
+def find_nearest_dated_month(cursor, target_month, sort_order='newest'):
+    """
+    Return the YYYY:MM month with photos nearest to a YYYY-MM target, or None.
+
+    Prefers the target year, landing on the side that lets the user scroll
+    naturally for the sort order; otherwise picks the closest month overall
+    (earlier month on ties). Each probe is a MIN/MAX seek on idx_date_taken.
+    """
+    def probe(aggregate, lower=None, upper=None):
+        clauses = ['date_taken IS NOT NULL']
+        params = []
+        if lower is not None:
+            clauses.append('date_taken >= ?')
+            params.append(lower)
+        if upper is not None:
+            clauses.append('date_taken < ?')
+            params.append(upper)
+        row = cursor.execute(
+            f"SELECT {aggregate}(date_taken) FROM photos WHERE {' AND '.join(clauses)}",
+            params,
+        ).fetchone()
+        return row[0][:7] if row and row[0] else None
+
+    year = int(target_month[:4])
+    month_lower, month_upper = month_bounds_for_sql(target_month)
+    year_lower = f"{year}:01:01 00:00:00"
+    year_upper = f"{year + 1}:01:01 00:00:00"
+
+    if sort_order == 'newest':
+        # Land at or after the target so the user scrolls down into earlier months.
+        in_year = probe('MIN', month_lower, year_upper) or probe('MAX', year_lower, year_upper)
+    else:
+        # Land at or before the target so the user scrolls down into later months.
+        in_year = probe('MAX', year_lower, month_upper) or probe('MIN', year_lower, year_upper)
+    if in_year:
+        return in_year
+
+    def month_ordinal(month_key):
+        return int(month_key[:4]) * 12 + int(month_key[5:7])
+
+    target_ordinal = month_ordinal(normalize_month_for_sql(target_month))
+    candidates = [
+        month_key
+        for month_key in (probe('MAX', upper=year_lower), probe('MIN', lower=year_upper))
+        if month_key
+    ]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda month_key: abs(month_ordinal(month_key) - target_ordinal))
+
+
 @app.route('/api/photos/nearest_month')
 @handle_db_corruption
 def get_nearest_month():
@@ -3647,49 +3791,14 @@ def get_nearest_month():
         if not target_month:
             return jsonify({'error': 'month parameter required (format: YYYY-MM)'}), 400
         
-        target_year = target_month[:4]
-        target_month_num = int(target_month[5:7])
-        
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        # Get all available months
-        cursor.execute("""
-            SELECT DISTINCT substr(date_taken, 1, 7) as month
-            FROM photos
-            WHERE date_taken IS NOT NULL
-            ORDER BY month
-        """)
-        all_months = [row['month'] for row in cursor.fetchall()]
+        result = find_nearest_dated_month(cursor, target_month, sort_order)
         conn.close()
         
-        if not all_months:
+        if not result:
             return jsonify({'error': 'No photos found in database'}), 404
         
-        # Step 1: Check if target year has any photos
-        year_months = [m for m in all_months if m[:4] == target_year]
-        
-        if year_months:
-            # Target year exists - find natural entry point based on sort order
-            if sort_order == 'newest':
-                # For newest first: land at or after target month
-                # (so user scrolls down to see earlier months in year)
-                candidates = [m for m in year_months if int(m[5:7]) >= target_month_num]
-                result = min(candidates) if candidates else max(year_months)
-            else:
-                # For oldest first: land at or before target month
-                # (so user scrolls down to see later months in year)
-                candidates = [m for m in year_months if int(m[5:7]) <= target_month_num]
-                result = max(candidates) if candidates else min(year_months)
-        else:
-            # Target year doesn't exist - find closest month overall (ignore sort)
-            def month_distance(m):
-                m_year = int(m[:4])
-                m_month = int(m[5:7])
-                return abs((m_year * 12 + m_month) - (int(target_year) * 12 + target_month_num))
-            
-            result = min(all_months, key=month_distance)
-        
         # Normalize month format from YYYY:MM to YYYY-MM
         normalized = result.replace(':', '-')
         return jsonify({'nearest_month': normalized})
@@ -3793,20 +3902,25 @@ def scan_import_paths():
                     return True
             return False
 
-        def add_media_file(full_path):
+        def add_media_file(full_path, entry=None):
             nonlocal photo_count, video_count, photo_bytes, video_bytes
 
-            if path_is_hidden(full_path):
-                return False
+            # Folder scans hand over entries that are already known to be
+            # visible media; only directly picked files need the checks.
+            if entry is None:
+                if path_is_hidden(full_path):
+                    return False
 
-            _, ext = os.path.splitext(full_path)
-            ext_lower = ext.lower()
-            if ext_lower not in PHOTO_EXTENSIONS and ext_lower not in VIDEO_EXTENSIONS:
-                return False
+                _, ext = os.path.splitext(full_path)
+                ext_lower = ext.lower()
+                if ext_lower not in PHOTO_EXTENSIONS and ext_lower not in VIDEO_EXTENSIONS:
+                    return False
+            else:
+                ext_lower = os.path.splitext(entry.name)[1].lower()
 
             media_files.append(full_path)
             try:
-                size_bytes = os.path.getsize(full_path)
+                size_bytes = entry.stat().st_size if entry is not None else os.path.getsize(full_path)
             except OSError:
                 size_bytes = 0
 
@@ -3837,13 +3951,8 @@ def scan_import_paths():
                 folders_count += 1
                 print(f"  📁 Scanning folder: {path}")
                 
-                for root, dirs, files in os.walk(path, followlinks=False):
-                    dirs[:] = [d for d in dirs if not d.startswith('.')]
-                    for filename in files:
-                        if filename.startswith('.'):
-                            continue
-                        full_path = os.path.join(root, filename)
-                        add_media_file(full_path)
+                for _rel_path, entry in iter_visible_media_entries(path):
+                    add_media_file(entry.path, entry)
         
         print(f"  ✅ Found {len(media_files)} media files")
         print(f"     {files_count} direct file(s), {folders_count} folder(s) scanned")
@@ -3889,6 +3998,7 @@ def import_from_paths():
         conn = None
         client_disconnected = False
         grid_read_caches_invalidated = False
+        pending_events = []
 
         def invalidate_import_grid_caches():
             nonlocal grid_read_caches_invalidated
@@ -3903,8 +4013,17 @@ def import_from_paths():
             if client_disconnected:
                 return False
 
+            # Log entries ride along with the event that closes their file
+            # (progress/rejected), so each file is one write and the progress
+            # bar never waits on the next, possibly slow, file.
+            pending_events.append(f"event: {event_name}\ndata: {json.dumps(payload)}\n\n")
+            if event_name == 'log':
+                return True
+
+            chunk = ''.join(pending_events)
+            pending_events.clear()
             try:
-                yield f"event: {event_name}\ndata: {json.dumps(payload)}\n\n"
+                yield chunk
                 return True
             except (BrokenPipeError, ConnectionError, GeneratorExit):
                 client_disconnected = True
@@ -4127,37 +4246,50 @@ def copy_rejected_files():
         return jsonify({'error': str(e)}), 500
 
 
+# Concurrent background thumbnail generators (capped by CPU count).
+THUMBNAIL_BACKGROUND_WORKERS = 4
+
+
 def start_background_thumbnail_generation(photo_ids):
     """
     Start background thread to pre-generate thumbnails for recently imported photos.
     This runs AFTER import completes, so it doesn't block the import process.
     """
     import threading
-    
+    from concurrent.futures import ThreadPoolExecutor
+
+    def generate(row):
+        try:
+            # Generate thumbnail (will be cached)
+            full_path = os.path.join(LIBRARY_PATH, row['current_path'])
+            if os.path.exists(full_path):
+                # Trigger the lazy generation by calling the function directly
+                # The thumbnail endpoint would do this on first request anyway
+                generate_thumbnail_for_file(full_path, row['content_hash'], row['file_type'])
+        except Exception as e:
+            # Don't let thumbnail failures crash the background thread
+            error_logger.warning(f"Background thumbnail generation failed for photo {row['id']}: {e}")
+
     def worker():
-        for photo_id in photo_ids:
-            try:
-                # Fetch photo info including hash
-                conn = get_db_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT current_path, file_type, content_hash FROM photos WHERE id = ?", (photo_id,))
-                row = cursor.fetchone()
-                conn.close()
-                
-                if not row:
-                    continue
-                
-                # Generate thumbnail (will be cached)
-                full_path = os.path.join(LIBRARY_PATH, row['current_path'])
-                if os.path.exists(full_path):
-                    # Trigger the lazy generation by calling the function directly
-                    # The thumbnail endpoint would do this on first request anyway
-                    generate_thumbnail_for_file(full_path, row['content_hash'], row['file_type'])
-                    print(f"  🖼️  Background: Generated thumbnail for photo {photo_id}")
-            except Exception as e:
-                # Don't let thumbnail failures crash the background thread
-                error_logger.warning(f"Background thumbnail generation failed for photo {photo_id}: {e}")
-                continue
+        # One connection and one IN (...) lookup per chunk instead of per photo.
+        conn = get_db_connection()
+        try:
+            rows = list(iter_rows_for_ids(
+                conn.cursor(),
+                "SELECT id, current_path, file_type, content_hash FROM photos WHERE id IN ({placeholders})",
+                photo_ids,
+            ))
+        except Exception as e:
+            error_logger.warning(f"Background thumbnail generation could not load photos: {e}")
+            return
+        finally:
+            conn.close()
+
+        # Decode/resize/encode release the GIL inside Pillow and ffmpeg runs as a
+        # subprocess, so a few threads overlap well without pickling app globals.
+        max_workers = min(THUMBNAIL_BACKGROUND_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ThumbnailGenerator") as pool:
+            list(pool.map(generate, rows))
     
     # Start daemon thread (won't prevent app shutdown)
     thread = threading.Thread(target=worker, daemon=True, name="ThumbnailGenerator")
@@ -4207,9 +4339,14 @@ def execute_rebuild_database():
     Rebuild database from scratch: Index all media files in library.
     
     This is the recovery mode - treats database as empty and indexes everything.
+    The rebuild runs on a worker thread so a slow file never stalls the SSE
+    stream; the response only drains the worker's event queue.
     """
+    event_queue: queue.Queue = queue.Queue()
+    cancel_event = threading.Event()
     
-    def generate():
+    def run_op():
+        conn = None
         try:
             import_logger.info("Rebuild Database execute started")
             
@@ -4247,20 +4384,43 @@ def execute_rebuild_database():
             
             conn = get_db_connection()
             
-            for event in synchronize_library_generator(
+            sync_events = synchronize_library_generator(
                 LIBRARY_PATH,
                 conn,
                 get_image_dimensions,
                 mode='full',
-            ):
-                if event.startswith('event: complete'):
-                    bump_library_catalog_revision()
-                yield event
+            )
+            try:
+                for event in sync_events:
+                    if cancel_event.is_set():
+                        import_logger.info("Rebuild Database execute stopped: client disconnected")
+                        return
+                    if event.startswith('event: complete'):
+                        bump_library_catalog_revision()
+                    event_queue.put(('evt', event))
+            finally:
+                sync_events.close()
             import_logger.info("Rebuild Database execute completed")
         except Exception as e:
             error_logger.error(f"Rebuild Database execute failed: {e}")
             print(f"\n❌ Rebuild Database execute failed: {e}")
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            event_queue.put(('evt', f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"))
+        finally:
+            if conn is not None:
+                conn.close()
+            event_queue.put(('done', None))
+    
+    threading.Thread(target=run_op, daemon=True, name="RebuildDatabase").start()
+    
+    def generate():
+        try:
+            while True:
+                kind, payload = event_queue.get()
+                if kind == 'done':
+                    break
+                yield payload
+        finally:
+            cancel_event.set()
     
     return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
@@ -255,7 +255,7 @@ def run_fast_library_audit(
             if filename in IGNORED_LIBRARY_FILES:
                 continue
             full_path = os.path.join(root, filename)
-            rel_path = os.path.relpath(full_path, library_path)
+            rel_path = filename if rel_root == "." else os.path.join(rel_root, filename)
             ext = os.path.splitext(filename)[1].lower()
 
             if not is_supported_media_extension(ext):
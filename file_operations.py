@@ -13,7 +13,7 @@ All functions handle errors gracefully and return None on failure.
 import os
 import subprocess
 import json
-from PIL import Image, ImageOps
+from PIL import ExifTags, Image
 from pillow_heif import register_heif_opener
 from library_cleanliness import VIDEO_MEDIA_EXTENSIONS
 from media_dates import read_embedded_media_date
@@ -98,8 +98,13 @@ def get_dimensions(file_path):
         
         with Image.open(file_path) as img:
             # Get dimensions AFTER applying EXIF orientation (matches display).
-            img_oriented = ImageOps.exif_transpose(img)
-            return img_oriented.size  # (width, height)
+            # Header size + orientation tag only: exif_transpose would decode
+            # every pixel just to report the size.
+            width, height = img.size
+            orientation = img.getexif().get(ExifTags.Base.Orientation)
+            if orientation in (5, 6, 7, 8):
+                width, height = height, width
+            return width, height
     
     except Exception:
         pass
@@ -332,14 +337,10 @@ def compute_hash_legacy(file_path):
     Returns:
         str: Full SHA-256 hash (64 chars)
     """
-    import hashlib
+    from hash_cache import hash_file_sha256
     
     try:
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(1048576), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return hash_file_sha256(file_path)
     except Exception as e:
         print(f"❌ Error hashing {file_path}: {e}")
         return None
@@ -10,6 +10,7 @@ Pre-generate all thumbnails for the photo library
 import sqlite3
 import os
 import gc
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 
 from image_pixels import (
@@ -23,6 +24,9 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, '..', 'migration', 'databases', 'photo_library_nas2_full.db')
 LIBRARY_PATH = '/Volumes/eric_files/photo_library'
 THUMBNAIL_CACHE_DIR = os.path.join(LIBRARY_PATH, '.thumbnails')
+# Pillow releases the GIL while decoding/resizing and ffmpeg is a subprocess,
+# so threads overlap well (same approach as the app's background generator).
+THUMBNAIL_WORKERS = min(4, os.cpu_count() or 1)
 
 def get_db_connection():
     """Create database connection"""
@@ -30,6 +34,23 @@ def get_db_connection():
     conn.row_factory = sqlite3.Row
     return conn
 
+def generate_one(photo):
+    """Generate one thumbnail; returns an error message, or None on success."""
+    relative_path = photo['current_path']
+    full_path = os.path.join(LIBRARY_PATH, relative_path)
+    if not os.path.exists(full_path):
+        return f"File not found: {full_path}"
+
+    thumbnail_path = thumbnail_cache_path(THUMBNAIL_CACHE_DIR, photo['content_hash'], mkdir=True)
+    try:
+        if photo['file_type'] == 'video':
+            generate_video_square_thumbnail(full_path, thumbnail_path)
+        else:
+            generate_still_square_thumbnail(full_path, thumbnail_path)
+    except Exception as e:
+        return f"Error generating thumbnail for {relative_path}: {e}"
+    return None
+
 def main():
     print("🖼️  Photo Thumbnail Generator")
     print("=" * 50)
@@ -85,42 +106,25 @@ def main():
     error_count = 0
     keepalive_file = os.path.join(THUMBNAIL_CACHE_DIR, '.keepalive')
 
-    for i, photo in enumerate(tqdm(to_generate, desc="Progress", unit="photo")):
-        if i % 100 == 0:
-            try:
-                with open(keepalive_file, 'w') as f:
-                    f.write(str(i))
-            except OSError:
-                pass
-            gc.collect()
-
-        relative_path = photo['current_path']
-        file_type = photo['file_type']
-        content_hash = photo['content_hash']
-        full_path = os.path.join(LIBRARY_PATH, relative_path)
-        thumbnail_path = thumbnail_cache_path(THUMBNAIL_CACHE_DIR, content_hash, mkdir=True)
-
-        if not os.path.exists(full_path):
-            error_count += 1
-            if error_count <= 5:
-                print(f"\n❌ File not found: {full_path}")
-            continue
-
-        try:
-            if file_type == 'video':
-                temp_frame = thumbnail_path + '.temp.jpg'
-                generate_video_square_thumbnail(
-                    full_path,
-                    thumbnail_path,
-                    temp_frame_path=temp_frame,
-                )
-            else:
-                generate_still_square_thumbnail(full_path, thumbnail_path)
-            success_count += 1
-        except Exception as e:
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS) as pool:
+        results = pool.map(generate_one, to_generate)
+        for i, error in enumerate(
+            tqdm(results, total=needs_generation, desc="Progress", unit="photo")
+        ):
+            if i % 100 == 0:
+                try:
+                    with open(keepalive_file, 'w') as f:
+                        f.write(str(i))
+                except OSError:
+                    pass
+                gc.collect()
+
+            if error is None:
+                success_count += 1
+                continue
             error_count += 1
             if error_count <= 5:
-                print(f"\n❌ Error generating thumbnail for {relative_path}: {e}")
+                print(f"\n❌ {error}")
 
     print("\n" + "=" * 50)
     print("✅ Thumbnail generation complete!")
@@ -12,10 +12,54 @@ Usage:
 """
 
 import os
+import queue
 import hashlib
 from datetime import datetime
 from collections import OrderedDict
 
+# Read size for streaming file hashes. Large reads suit network storage and
+# spinning disks: 4MB keeps a video hash to a few hundred read calls.
+HASH_READ_CHUNK_SIZE = 4 * 1048576
+# Read buffers kept for reuse between hashes; concurrent hashes beyond this
+# allocate their own and drop it afterwards.
+HASH_BUFFER_POOL_SIZE = 4
+
+_hash_buffer_pool = queue.LifoQueue(maxsize=HASH_BUFFER_POOL_SIZE)
+
+
+def hash_file_sha256(file_path):
+    """
+    Stream a file through SHA-256 and return the full hex digest.
+
+    This is the single content-hash primitive for the library. SHA-256 hex is
+    part of the on-disk identity (canonical filenames embed its prefix and every
+    photos.content_hash row stores it), so the algorithm must not change here
+    without a library-wide migration.
+
+    Raises OSError when the file cannot be read.
+    """
+    # Content identity, not a security boundary: skip FIPS-restricted paths.
+    sha256_hash = hashlib.sha256(usedforsecurity=False)
+    # Unbuffered readinto() a pooled buffer: one syscall per chunk, no fresh
+    # bytes object per read and no zeroed 4MB allocation per file.
+    try:
+        buffer = _hash_buffer_pool.get_nowait()
+    except queue.Empty:
+        buffer = bytearray(HASH_READ_CHUNK_SIZE)
+    try:
+        with open(file_path, "rb", buffering=0) as f, memoryview(buffer) as view:
+            while True:
+                size = f.readinto(view)
+                if not size:
+                    break
+                sha256_hash.update(view[:size])
+    finally:
+        try:
+            _hash_buffer_pool.put_nowait(buffer)
+        except queue.Full:
+            pass
+    return sha256_hash.hexdigest()
+
 
 class HashCache:
     """
@@ -64,6 +108,34 @@ class HashCache:
         Returns:
             (None, False) if file doesn't exist or error
         """
+        cache_key, content_hash = self.lookup(file_path)
+        if cache_key is None:
+            return None, False
+        if content_hash is not None:
+            return content_hash, True
+        
+        # Cache miss - compute hash
+        content_hash = self._compute_hash(file_path)
+        
+        if content_hash is None:
+            return None, False
+        
+        self.remember(cache_key, content_hash)
+        return content_hash, False
+    
+    def lookup(self, file_path):
+        """
+        Look up a file's hash in the caches without computing it.
+        
+        Args:
+            file_path: Absolute path to file
+        
+        Returns:
+            tuple: (cache_key, content_hash)
+            - cache_key: None if the file can't be stat'ed
+            - content_hash: None on a cache miss; pass cache_key to
+              remember() once the hash has been computed
+        """
         self.stats['total_queries'] += 1
         
         # Get file stats
@@ -71,7 +143,7 @@ class HashCache:
             stat = os.stat(file_path)
         except OSError as e:
             print(f"⚠️  Cannot stat file {file_path}: {e}")
-            return None, False
+            return None, None
         
         cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
         
@@ -80,7 +152,7 @@ class HashCache:
             # Move to end (mark as recently used)
             self.memory_cache.move_to_end(cache_key)
             self.stats['memory_hits'] += 1
-            return self.memory_cache[cache_key], True
+            return cache_key, self.memory_cache[cache_key]
         
         # Level 2: Check database cache
         cursor = self.db_conn.cursor()
@@ -98,20 +170,21 @@ class HashCache:
             self._add_to_memory_cache(cache_key, content_hash)
             
             self.stats['db_hits'] += 1
-            return content_hash, True
+            return cache_key, content_hash
         
-        # Cache miss - compute hash
-        content_hash = self._compute_hash(file_path)
-        
-        if content_hash is None:
-            return None, False
+        return cache_key, None
+    
+    def remember(self, cache_key, content_hash, commit=True):
+        """
+        Record a freshly computed hash for a cache_key from lookup().
         
+        Pass commit=False when the caller commits its own batch.
+        """
         # Store FULL hash in both caches (64 chars for uniqueness)
         self._add_to_memory_cache(cache_key, content_hash)
-        self._add_to_db_cache(cache_key, content_hash)
+        self._add_to_db_cache(cache_key, content_hash, commit=commit)
         
         self.stats['misses'] += 1
-        return content_hash, False
     
     def _compute_hash(self, file_path):
         """
@@ -124,13 +197,7 @@ class HashCache:
             str: Full SHA-256 hash (64 chars), or None on error
         """
         try:
-            sha256_hash = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                # Read in 1MB chunks (optimal for network storage)
-                for byte_block in iter(lambda: f.read(1048576), b""):
-                    sha256_hash.update(byte_block)
-            
-            return sha256_hash.hexdigest()
+            return hash_file_sha256(file_path)
         
         except Exception as e:
             print(f"❌ Error hashing file {file_path}: {e}")
@@ -149,7 +216,7 @@ class HashCache:
             # Remove first item (oldest)
             self.memory_cache.popitem(last=False)
     
-    def _add_to_db_cache(self, cache_key, content_hash):
+    def _add_to_db_cache(self, cache_key, content_hash, commit=True):
         """
         Add entry to database cache.
         Stores FULL 64-char hash for maximum uniqueness and cache hit accuracy.
@@ -163,7 +230,8 @@ class HashCache:
             VALUES (?, ?, ?, ?, ?)
         """, (file_path, mtime_ns, file_size, content_hash, datetime.now().isoformat()))
         
-        self.db_conn.commit()
+        if commit:
+            self.db_conn.commit()
     
     def invalidate_file(self, file_path):
         """
@@ -273,12 +341,8 @@ def compute_hash_legacy(file_path):
     Returns:
         str: SHA-256 hash (full 64 chars)
     """
-    sha256_hash = hashlib.sha256()
     try:
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(1048576), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return hash_file_sha256(file_path)
     except Exception as e:
         print(f"❌ Error hashing file {file_path}: {e}")
         return None
@@ -87,22 +87,32 @@ def _sips_decode_to_pil(file_path: str) -> Image.Image:
             os.remove(temp_path)
 
 
-def open_still_image(file_path: str) -> Image.Image:
+def open_still_image(file_path: str, *, min_size: Optional[int] = None) -> Image.Image:
     """
     Decode a still image to a PIL Image copy with display orientation applied.
 
+    With min_size, JPEGs decode through libjpeg's DCT scaling at the smallest
+    1/2, 1/4 or 1/8 scale that keeps both sides at least min_size pixels.
+
     Caller owns the returned image and should close it when finished.
     """
     if should_decode_with_sips(file_path):
         return _sips_decode_to_pil(file_path)
 
     try:
-        with Image.open(file_path) as opened:
-            image = opened.copy()
+        # Decode from a handle we own and orient in place: the pixels are read
+        # once, with no .copy() to detach them from the file and no second
+        # full-size raster from exif_transpose.
+        with open(file_path, "rb") as handle:
+            image = Image.open(handle)
+            if min_size:
+                image.draft(image.mode, (min_size, min_size))
+            image.load()
         try:
-            return ImageOps.exif_transpose(image)
+            ImageOps.exif_transpose(image, in_place=True)
         except Exception:
-            return image
+            pass
+        return image
     except Exception:
         if is_macos():
             return _sips_decode_to_pil(file_path)
@@ -200,18 +210,24 @@ def save_square_jpeg_thumbnail(
     elif image.mode != "RGB":
         image = image.convert("RGB")
 
+    # Resample only the source box that survives the center crop, and let
+    # Pillow box-reduce by an integer factor before the LANCZOS pass.
     width, height = image.size
     if width < height:
-        new_width = target_size
-        new_height = int(height * (target_size / width))
+        scale = target_size / width
+        top = (int(height * scale) - target_size) // 2
+        box = (0, top / scale, width, (top + target_size) / scale)
     else:
-        new_height = target_size
-        new_width = int(width * (target_size / height))
-
-    image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-    left = (image.width - target_size) // 2
-    top = (image.height - target_size) // 2
-    image = image.crop((left, top, left + target_size, top + target_size))
+        scale = target_size / height
+        left = (int(width * scale) - target_size) // 2
+        box = (left / scale, 0, (left + target_size) / scale, height)
+
+    image = image.resize(
+        (target_size, target_size),
+        Image.Resampling.LANCZOS,
+        box=box,
+        reducing_gap=3.0,
+    )
 
     save_kwargs = {"format": "JPEG", "quality": quality, "optimize": True}
     if icc_profile:
@@ -227,7 +243,7 @@ def generate_still_square_thumbnail(
     target_size: int = DEFAULT_SQUARE_THUMB_SIZE,
     quality: int = DEFAULT_SQUARE_THUMB_QUALITY,
 ) -> None:
-    image = open_still_image(file_path)
+    image = open_still_image(file_path, min_size=target_size)
     try:
         save_square_jpeg_thumbnail(
             image,
@@ -244,11 +260,11 @@ def generate_video_square_thumbnail(
     video_path: str,
     output_path: str,
     *,
-    temp_frame_path: str,
     to_rgb: Optional[RgbConverter] = None,
     target_size: int = DEFAULT_SQUARE_THUMB_SIZE,
     quality: int = DEFAULT_SQUARE_THUMB_QUALITY,
 ) -> None:
+    """Grab the first frame over a pipe (no temp file) and square-crop it."""
     cmd = [
         "ffmpeg",
         "-i",
@@ -257,26 +273,25 @@ def generate_video_square_thumbnail(
         "1",
         "-vf",
         "scale=800:-1",
-        "-y",
-        temp_frame_path,
+        "-f",
+        "image2pipe",
+        "-c:v",
+        "mjpeg",
+        "-",
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0 or not os.path.exists(temp_frame_path):
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0 or not result.stdout:
         raise RuntimeError("Failed to extract video frame")
 
-    try:
-        with Image.open(temp_frame_path) as frame:
-            image = frame.copy()
-        save_square_jpeg_thumbnail(
-            image,
-            output_path,
-            target_size=target_size,
-            quality=quality,
-            to_rgb=to_rgb,
-        )
-    finally:
-        if os.path.exists(temp_frame_path):
-            os.remove(temp_frame_path)
+    with Image.open(BytesIO(result.stdout)) as frame:
+        image = frame.copy()
+    save_square_jpeg_thumbnail(
+        image,
+        output_path,
+        target_size=target_size,
+        quality=quality,
+        to_rgb=to_rgb,
+    )
 
 
 def preview_decode_error_message(file_path: str, error: Exception) -> str:
@@ -449,7 +464,7 @@ def generate_preview_jpeg_buffer(
     to_rgb: Optional[RgbConverter] = None,
 ) -> BytesIO:
     """Small aspect-preserving preview for the photo picker."""
-    image = open_still_image(file_path)
+    image = open_still_image(file_path, min_size=max_size)
     try:
         if to_rgb is not None:
             image = to_rgb(image)
@@ -113,6 +113,10 @@ VIDEO_MEDIA_EXTENSIONS = frozenset(
     }
 )
 ALL_MEDIA_EXTENSIONS = PHOTO_MEDIA_EXTENSIONS | VIDEO_MEDIA_EXTENSIONS
+MEDIA_KIND_BY_EXTENSION = {
+    **{ext: "photo" for ext in PHOTO_MEDIA_EXTENSIONS},
+    **{ext: "video" for ext in VIDEO_MEDIA_EXTENSIONS},
+}
 EXIF_WRITABLE_PHOTO_EXTENSIONS = frozenset(
     {
         ".jpg",
@@ -144,18 +148,43 @@ def parse_metadata_datetime(value: Optional[str], fallback_timestamp: float) ->
     return normalized, parsed
 
 
+def parse_canonical_db_date(value: str) -> datetime:
+    """Parse the app canonical date string: YYYY:MM:DD HH:MM:SS."""
+    # Read well-formed strings at fixed offsets; strptime re-parses its format
+    # on every call. Anything irregular keeps strptime's leniency and errors.
+    if len(value) == 19 and value[4] == value[7] == value[13] == value[16] == ":" and value[10] == " ":
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+        if digits.isascii() and digits.isdigit():
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+            )
+    return datetime.strptime(value, CANONICAL_DB_DATE_FORMAT)
+
+
 def canonical_relative_path(date_obj: datetime, content_hash: str, ext: str) -> str:
     """Return the canonical library-relative path for a media file."""
-    year = date_obj.strftime("%Y")
-    day = date_obj.strftime("%Y-%m-%d")
+    if date_obj.year >= 1000:
+        year = str(date_obj.year)
+        day = f"{year}-{date_obj.month:02d}-{date_obj.day:02d}"
+        compact = f"{year}{date_obj.month:02d}{date_obj.day:02d}"
+    else:
+        # %Y padding below year 1000 differs by platform libc; keep its output.
+        year = date_obj.strftime("%Y")
+        day = date_obj.strftime("%Y-%m-%d")
+        compact = date_obj.strftime("%Y%m%d")
     short_hash = content_hash[:8]
-    filename = f"img_{date_obj.strftime('%Y%m%d')}_{short_hash}{ext.lower()}"
+    filename = f"img_{compact}_{short_hash}{ext.lower()}"
     return os.path.join(year, day, filename)
 
 
 def build_canonical_photo_path(date_taken: str, content_hash: str, ext: str) -> Tuple[str, str]:
     """Return the canonical relative path and basename for a DB date string."""
-    date_obj = datetime.strptime(date_taken, CANONICAL_DB_DATE_FORMAT)
+    date_obj = parse_canonical_db_date(date_taken)
     relative_path = canonical_relative_path(date_obj, content_hash, ext)
     return relative_path, os.path.basename(relative_path)
 
@@ -165,12 +194,7 @@ def is_supported_media_extension(ext: str) -> bool:
 
 
 def media_kind_for_extension(ext: str) -> Optional[Literal["photo", "video"]]:
-    normalized = ext.lower()
-    if normalized in PHOTO_MEDIA_EXTENSIONS:
-        return "photo"
-    if normalized in VIDEO_MEDIA_EXTENSIONS:
-        return "video"
-    return None
+    return MEDIA_KIND_BY_EXTENSION.get(ext.lower())
 
 
 def is_year_folder_name(name: str) -> bool:
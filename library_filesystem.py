@@ -8,6 +8,7 @@ content is removed before final audit.
 
 from __future__ import annotations
 
+import errno
 import os
 import shutil
 import sqlite3
@@ -44,12 +45,13 @@ def _abs_library_path(library_path: str) -> str:
     return os.path.abspath(library_path)
 
 
-def _filter_walk_dirs(library_path: str, root: str, dirs: List[str]) -> None:
-    dirs[:] = [
-        entry
-        for entry in dirs
-        if not in_infrastructure(os.path.relpath(os.path.join(root, entry), library_path))
-    ]
+def _join_rel(rel_root: str, name: str) -> str:
+    """Child path relative to the library, given its folder's relpath (``.`` for root)."""
+    return name if rel_root == "." else os.path.join(rel_root, name)
+
+
+def _filter_walk_dirs(rel_root: str, dirs: List[str]) -> None:
+    dirs[:] = [entry for entry in dirs if not in_infrastructure(_join_rel(rel_root, entry))]
 
 
 def iter_library_walk(library_path: str) -> Iterator[Tuple[str, List[str], List[str]]]:
@@ -60,7 +62,7 @@ def iter_library_walk(library_path: str) -> Iterator[Tuple[str, List[str], List[
         if rel_root != "." and in_infrastructure(rel_root):
             dirs[:] = []
             continue
-        _filter_walk_dirs(library_path, root, dirs)
+        _filter_walk_dirs(rel_root, dirs)
         yield root, dirs, files
 
 
@@ -166,7 +168,7 @@ def directory_tree_has_media(dir_path: str, *, library_path: str) -> bool:
         if rel_root != "." and in_infrastructure(rel_root):
             dirs[:] = []
             continue
-        _filter_walk_dirs(library_path, root, dirs)
+        _filter_walk_dirs(rel_root, dirs)
 
         for filename in files:
             if filename in IGNORED_LIBRARY_FILES:
@@ -385,6 +387,21 @@ def iter_layout_cleanup_passes(
             break
 
 
+def move_file(source_path: str, destination_path: str) -> None:
+    """
+    Rename a file into place, copying only when it has to cross a filesystem.
+
+    Trash, import temp, and library folders normally share a volume, so the
+    common case is a single rename syscall with no byte copying.
+    """
+    try:
+        os.replace(source_path, destination_path)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+        shutil.move(source_path, destination_path)
+
+
 def move_file_to_category_trash(
     library_path: str,
     trash_dir: str,
@@ -403,7 +420,7 @@ def move_file_to_category_trash(
         candidate = f"{base}_{counter}{ext}"
         counter += 1
 
-    shutil.move(source_path, candidate)
+    move_file(source_path, candidate)
     return candidate
 
 
@@ -420,20 +437,25 @@ class BlockingCleanupStats:
         return self.trashed_corrupt + self.trashed_errors
 
 
+def _select_current_paths(conn: sqlite3.Connection) -> Set[str]:
+    # Plain tuples straight off the cursor: no Row wrappers, no fetchall list.
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return {current_path for (current_path,) in cursor.execute("SELECT current_path FROM photos")}
+
+
 def _load_db_media_paths(
     *,
     db_conn: Optional[sqlite3.Connection] = None,
     db_path: Optional[str] = None,
 ) -> Set[str]:
     if db_conn is not None:
-        rows = db_conn.execute("SELECT current_path FROM photos").fetchall()
-        return {row[0] for row in rows}
+        return _select_current_paths(db_conn)
 
     if db_path and os.path.exists(db_path):
         conn = sqlite3.connect(f"file:{os.path.abspath(db_path)}?mode=ro", uri=True)
         try:
-            rows = conn.execute("SELECT current_path FROM photos").fetchall()
-            return {row[0] for row in rows}
+            return _select_current_paths(conn)
         finally:
             conn.close()
 
@@ -467,6 +489,7 @@ def ensure_blocking_audit_prep(
 
     db_paths = _load_db_media_paths(db_conn=db_conn, db_path=db_path)
     for root, _dirs, files in iter_library_walk(library_path):
+        rel_root = os.path.relpath(root, library_path)
         for filename in files:
             if filename in IGNORED_LIBRARY_FILES:
                 continue
@@ -476,7 +499,7 @@ def ensure_blocking_audit_prep(
                 continue
 
             full_path = os.path.join(root, filename)
-            rel_path = os.path.relpath(full_path, library_path)
+            rel_path = _join_rel(rel_root, filename)
             if rel_path in db_paths or not os.path.exists(full_path):
                 continue
 
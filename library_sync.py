@@ -10,14 +10,180 @@ Version: v3 - Simplified (removed operation_state complexity)
 
 import os
 import json
-from hash_cache import HashCache
+import sqlite3
+import time
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from hash_cache import HashCache, hash_file_sha256
+from photo_catalog import IN_CLAUSE_CHUNK_SIZE, insert_photo_rows, iter_rows_for_ids
 from library_cleanliness import (
-    is_supported_media_extension,
+    ALL_MEDIA_EXTENSIONS,
     media_kind_for_extension,
 )
 from media_dates import read_media_date
 
 
+# A rebuild pre-scan is followed by its execute call within seconds; keep the
+# scan around briefly so the execute step does not walk the library again.
+LIBRARY_SCAN_REUSE_SECONDS = 60
+
+# Untracked files are hashed and probed (EXIF date, dimensions) on worker
+# threads; hashlib and the exiftool/ffprobe subprocesses release the GIL.
+# Catalog and hash-cache writes stay on the generator's own connection.
+UNTRACKED_FILE_WORKERS = 4
+UNTRACKED_FILE_PREFETCH = 32
+# Rows (and computed hashes) written per executemany + commit while adding
+# untracked files.
+UNTRACKED_COMMIT_BATCH = 500
+
+# Minimum seconds between routine progress events. The first and last event
+# of each phase always go out, so the dialog still shows start and finish.
+SYNC_PROGRESS_INTERVAL = 0.1
+
+# str.endswith() takes a tuple and checks it in C, so the walker can filter
+# names without splitext() per entry.
+_MEDIA_SUFFIXES = tuple(sorted(ALL_MEDIA_EXTENSIONS))
+
+# Top-level library folders walked concurrently by scan_library().
+LIBRARY_SCAN_WORKERS = 8
+
+LibraryScan = namedtuple('LibraryScan', ['media_paths', 'folders'])
+
+# Holds at most one scan: only the estimate -> rebuild hand-off reuses it.
+_recent_library_scans = {}
+
+
+def _library_root_fingerprint(library_path):
+    try:
+        return os.stat(library_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_visible_entries(dir_path):
+    """
+    List dir_path as (entry, is_folder) for visible folders and media.
+    
+    Hidden names, non-media files and symlinked folders are dropped.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            entries = list(entries)
+    except OSError:
+        return []
+    
+    visible = []
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.'):
+            continue
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                visible.append((entry, True))
+        elif name.lower().endswith(_MEDIA_SUFFIXES):
+            visible.append((entry, False))
+    return visible
+
+
+def iter_visible_media_entries(root, folders=None, rel_root=''):
+    """
+    Yield (rel_path, os.DirEntry) for supported media under root.
+    
+    Hidden files and folders are skipped and symlinked folders are not
+    followed. Names and entry types come straight from the directory read,
+    so nothing is stat'ed unless the caller asks the entry for it. When
+    folders is a list, every visited folder's rel_path is appended to it,
+    parents before children. rel_root prefixes every rel_path.
+    """
+    pending = [(root, rel_root)]
+    
+    while pending:
+        dir_path, rel_dir = pending.pop()
+        for entry, is_folder in _read_visible_entries(dir_path):
+            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            if is_folder:
+                if folders is not None:
+                    folders.append(rel_path)
+                pending.append((entry.path, rel_path))
+            else:
+                yield rel_path, entry
+
+
+def _scan_library_subtree(library_path, rel_dir):
+    folders = []
+    media_paths = [
+        rel_path
+        for rel_path, _entry in iter_visible_media_entries(
+            os.path.join(library_path, rel_dir),
+            folders,
+            rel_root=rel_dir,
+        )
+    ]
+    return media_paths, folders
+
+
+def scan_library(library_path):
+    """
+    Walk the library once, skipping hidden files and folders.
+    
+    Returns:
+        LibraryScan: media_paths (library-relative paths of supported media)
+        and folders (library-relative non-hidden folders, parents before
+        children)
+    """
+    library_path = os.path.abspath(library_path)
+    fingerprint = _library_root_fingerprint(library_path)
+    media_paths = []
+    folders = []
+    top_folders = []
+    for entry, is_folder in _read_visible_entries(library_path):
+        if is_folder:
+            top_folders.append(entry.name)
+        else:
+            media_paths.append(entry.name)
+    folders.extend(top_folders)
+    
+    # Year folders are independent subtrees and the walk is mostly waiting on
+    # directory reads, so walk them side by side.
+    with ThreadPoolExecutor(max_workers=LIBRARY_SCAN_WORKERS) as executor:
+        subtree_scans = executor.map(
+            lambda rel_dir: _scan_library_subtree(library_path, rel_dir),
+            top_folders,
+        )
+        for subtree_media, subtree_folders in subtree_scans:
+            media_paths.extend(subtree_media)
+            folders.extend(subtree_folders)
+    
+    scan = LibraryScan(media_paths=media_paths, folders=folders)
+    _recent_library_scans.clear()
+    _recent_library_scans[library_path] = (time.monotonic(), fingerprint, scan)
+    return scan
+
+
+def take_recent_library_scan(library_path):
+    """
+    Return the last scan of library_path if it is still fresh, else None.
+    
+    A scan is reused at most once, only within LIBRARY_SCAN_REUSE_SECONDS and
+    only while the library folder's own mtime is unchanged.
+    """
+    library_path = os.path.abspath(library_path)
+    cached = _recent_library_scans.pop(library_path, None)
+    if cached is None:
+        return None
+    scanned_at, fingerprint, scan = cached
+    if time.monotonic() - scanned_at > LIBRARY_SCAN_REUSE_SECONDS:
+        return None
+    if fingerprint is None or fingerprint != _library_root_fingerprint(library_path):
+        return None
+    return scan
+
+
 def count_media_files(library_path):
     """
     Quick count of media files in library (for estimates).
@@ -25,17 +191,7 @@ def count_media_files(library_path):
     Returns:
         int: Number of media files found
     """
-    count = 0
-    for root, dirs, filenames in os.walk(library_path, followlinks=False):
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
-        for filename in filenames:
-            if filename.startswith('.'):
-                continue
-            ext = os.path.splitext(filename)[1].lower()
-            if is_supported_media_extension(ext):
-                count += 1
-    
-    return count
+    return len(scan_library(library_path).media_paths)
 
 
 def count_media_files_by_type(library_path):
@@ -48,17 +204,13 @@ def count_media_files_by_type(library_path):
     photo_count = 0
     video_count = 0
     
-    for root, dirs, filenames in os.walk(library_path, followlinks=False):
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
-        for filename in filenames:
-            if filename.startswith('.'):
-                continue
-            ext = os.path.splitext(filename)[1].lower()
-            media_kind = media_kind_for_extension(ext)
-            if media_kind == 'photo':
-                photo_count += 1
-            elif media_kind == 'video':
-                video_count += 1
+    for rel_path in scan_library(library_path).media_paths:
+        ext = os.path.splitext(rel_path)[1].lower()
+        media_kind = media_kind_for_extension(ext)
+        if media_kind == 'photo':
+            photo_count += 1
+        elif media_kind == 'video':
+            video_count += 1
     
     return {
         'photo_count': photo_count,
@@ -96,6 +248,198 @@ def estimate_duration(file_count):
         return (minutes, f"{int(hours)}-{int(hours * 1.3)} hours")
 
 
+def _probe_untracked_file(full_path, file_size, known_hash, get_image_dimensions_func):
+    """Read everything Phase 2 needs from one file; runs on a worker thread."""
+    content_hash = known_hash
+    if content_hash is None:
+        content_hash = hash_file_sha256(full_path)
+    
+    # Resolve date via shared read rulebook (no ingest-only mtime fallback)
+    date_taken = read_media_date(full_path, allow_mtime_fallback=False)
+    
+    # Get dimensions
+    dimensions = get_image_dimensions_func(full_path)
+    return {
+        'file_size': file_size,
+        'content_hash': content_hash,
+        'date_taken': date_taken,
+        'width': dimensions[0] if dimensions else None,
+        'height': dimensions[1] if dimensions else None,
+    }
+
+
+def _iter_probed_untracked_files(library_path, untracked_files_list, hash_cache,
+                                 get_image_dimensions_func):
+    """
+    Yield (mole_path, cache_key, cache_hit, future) in list order.
+    
+    Hash-cache lookups run here, on the caller's thread; the probe for each
+    file runs on a small thread pool, a bounded window ahead of the caller.
+    """
+    with ThreadPoolExecutor(max_workers=UNTRACKED_FILE_WORKERS) as executor:
+        pending = deque()
+        for mole_path in untracked_files_list:
+            full_path = os.path.join(library_path, mole_path)
+            cache_key, known_hash = hash_cache.lookup(full_path)
+            future = None
+            if cache_key is not None:
+                # The hash-cache key already carries the stat'ed size.
+                future = executor.submit(
+                    _probe_untracked_file,
+                    full_path,
+                    cache_key[2],
+                    known_hash,
+                    get_image_dimensions_func,
+                )
+            pending.append((mole_path, cache_key, known_hash is not None, future))
+            if len(pending) >= UNTRACKED_FILE_PREFETCH:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def _progress_due(current, total, last_emitted_at):
+    """True when progress event number current (1-based) should be sent."""
+    if current == 1 or current == total:
+        return True
+    return time.monotonic() - last_emitted_at >= SYNC_PROGRESS_INTERVAL
+
+
+def _progress_event(payload):
+    return f"event: progress\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+def _remove_folder_if_empty(folder_path):
+    """
+    Remove folder_path if it holds nothing but hidden files (like .DS_Store).
+    
+    Stops reading the folder at its first visible entry. Returns True when
+    the folder was removed; OSError from the final rmdir propagates.
+    """
+    hidden_files = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if not entry.name.startswith('.'):
+                return False
+            hidden_files.append(entry)
+    
+    # Remove any hidden files first
+    for entry in hidden_files:
+        try:
+            if entry.is_file():
+                os.remove(entry.path)
+        except OSError:
+            pass
+    
+    os.rmdir(folder_path)
+    return True
+
+
+def _load_catalog_paths(db_connection):
+    """
+    Load every catalog path with its id as two parallel arrays.
+    
+    Returns:
+        tuple: (paths, ids) sorted by path; ids is a compact array('q')
+    """
+    paths = []
+    ids = array('q')
+    add_path = paths.append
+    add_id = ids.append
+    # Plain tuples: skip building a sqlite3.Row for every catalog row.
+    cursor = db_connection.cursor()
+    cursor.row_factory = None
+    # current_path is UNIQUE, so its index hands rows back already sorted.
+    for current_path, photo_id in cursor.execute(
+        "SELECT current_path, id FROM photos ORDER BY current_path"
+    ):
+        add_path(current_path)
+        add_id(photo_id)
+    
+    if any(paths[index] > paths[index + 1] for index in range(len(paths) - 1)):
+        order = sorted(range(len(paths)), key=paths.__getitem__)
+        paths = [paths[index] for index in order]
+        ids = array('q', (ids[index] for index in order))
+    return paths, ids
+
+
+def _diff_sorted_paths(disk_paths, db_paths):
+    """
+    Merge-diff two sorted path lists.
+    
+    Returns:
+        tuple: (missing_indices, untracked_paths) - indexes into db_paths
+        whose file is gone, and disk paths with no catalog row; both sorted
+    """
+    missing_indices = []
+    untracked_paths = []
+    disk_index = 0
+    db_index = 0
+    
+    while disk_index < len(disk_paths) and db_index < len(db_paths):
+        disk_path = disk_paths[disk_index]
+        db_path = db_paths[db_index]
+        if disk_path == db_path:
+            disk_index += 1
+            db_index += 1
+        elif disk_path < db_path:
+            untracked_paths.append(disk_path)
+            disk_index += 1
+        else:
+            missing_indices.append(db_index)
+            db_index += 1
+    
+    untracked_paths.extend(disk_paths[disk_index:])
+    missing_indices.extend(range(db_index, len(db_paths)))
+    return missing_indices, untracked_paths
+
+
+def _insert_untracked_rows_one_by_one(db_connection, rows):
+    """Insert Phase 2 rows singly, skipping (and reporting) any that fail."""
+    added = []
+    for row in rows:
+        try:
+            if insert_photo_rows(db_connection, [row], ignore_conflicts=True):
+                added.append(row['current_path'])
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Failed to index {row['current_path']}: {e}")
+    return added
+
+
+def _insert_untracked_rows(db_connection, rows):
+    """
+    Insert one batch of Phase 2 rows and return the paths actually added.
+    
+    A batch that raises is rolled back and retried row by row, so one bad
+    file is skipped and reported instead of aborting the whole sync.
+    """
+    if not rows:
+        return []
+    paths = [row['current_path'] for row in rows]
+    cursor = db_connection.cursor()
+    cursor.execute("SAVEPOINT untracked_batch")
+    try:
+        inserted = insert_photo_rows(db_connection, rows, ignore_conflicts=True)
+    except sqlite3.Error:
+        cursor.execute("ROLLBACK TO untracked_batch")
+        cursor.execute("RELEASE untracked_batch")
+        return _insert_untracked_rows_one_by_one(db_connection, rows)
+    cursor.execute("RELEASE untracked_batch")
+    if inserted == len(rows):
+        return paths
+    
+    # Some rows were ignored (content_hash already cataloged).
+    present = {
+        row[0]
+        for row in iter_rows_for_ids(
+            db_connection.cursor(),
+            "SELECT current_path FROM photos WHERE current_path IN ({placeholders})",
+            paths,
+        )
+    }
+    return [path for path in paths if path in present]
+
+
 def synchronize_library_generator(library_path, db_connection,
                                    get_image_dimensions_func, mode='incremental'):
     """
@@ -121,41 +465,33 @@ def synchronize_library_generator(library_path, db_connection,
     
     # Phase 0: Scan filesystem
     print(f"\n🔄 LIBRARY SYNC ({mode} mode): Scanning filesystem...")
-    filesystem_paths = set()
-    
-    for root, dirs, filenames in os.walk(library_path, followlinks=False):
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
-        for filename in filenames:
-            if filename.startswith('.'):
-                continue
-            ext = os.path.splitext(filename)[1].lower()
-            if not is_supported_media_extension(ext):
-                continue
-            full_path = os.path.join(root, filename)
-            try:
-                rel_path = os.path.relpath(full_path, library_path)
-                filesystem_paths.add(rel_path)
-            except ValueError:
-                continue
+    # Only a rebuild may reuse its pre-scan: it starts from an empty catalog,
+    # so a file imported since the scan can't be mistaken for a ghost.
+    library_scan = take_recent_library_scan(library_path) if mode == 'full' else None
+    if library_scan is None:
+        library_scan = scan_library(library_path)
+    filesystem_paths = sorted(library_scan.media_paths)  # Sort for deterministic order
     
     print(f"  Found {len(filesystem_paths)} files on disk")
     
     # Determine what needs to be done based on mode
     if mode == 'full':
         # Rebuild mode: index everything, don't remove anything
-        db_entries = {}
         missing_files_list = []
-        untracked_files_list = sorted(list(filesystem_paths))  # Sort for deterministic order
+        missing_photo_ids = []
+        untracked_files_list = filesystem_paths
         print(f"  Full rebuild: indexing all {len(untracked_files_list)} files")
     else:
-        # Incremental mode: diff and sync
-        cursor.execute("SELECT id, current_path FROM photos")
-        db_entries = {row['current_path']: row['id'] for row in cursor.fetchall()}
-        db_paths = set(db_entries.keys())
+        # Incremental mode: diff and sync. No route runs this today (Rebuild
+        # Database always passes mode='full'); kept for a future fast sync.
+        db_paths, db_ids = _load_catalog_paths(db_connection)
         
-        missing_files_list = sorted(list(db_paths - filesystem_paths))  # Sort for deterministic order
-        untracked_files_list = sorted(list(filesystem_paths - db_paths))  # Sort for deterministic order
-        print(f"  Found {len(db_entries)} DB entries, {len(missing_files_list)} ghosts, {len(untracked_files_list)} moles")
+        missing_indices, untracked_files_list = _diff_sorted_paths(filesystem_paths, db_paths)
+        missing_files_list = [db_paths[index] for index in missing_indices]
+        missing_photo_ids = [db_ids[index] for index in missing_indices]
+        print(f"  Found {len(db_ids)} DB entries, {len(missing_files_list)} ghosts, {len(untracked_files_list)} moles")
+        # This generator lives for the whole sync; drop the catalog-wide arrays now.
+        del db_paths, db_ids
     
     # Track details for final report
     details = {
@@ -169,12 +505,15 @@ def synchronize_library_generator(library_path, db_connection,
     missing_count = len(missing_files_list)
     if missing_count > 0:
         print(f"\n🗑️  Removing {missing_count} missing files...")
-        for idx, ghost_path in enumerate(missing_files_list, 1):
-            yield f"event: progress\ndata: {json.dumps({'phase': 'removing_deleted', 'current': idx, 'total': missing_count})}\n\n"
-            
-            photo_id = db_entries[ghost_path]
-            cursor.execute("DELETE FROM photos WHERE id = ?", (photo_id,))
-            details['missing_files'].append(ghost_path)
+        for start in range(0, missing_count, IN_CLAUSE_CHUNK_SIZE):
+            ghost_paths = missing_files_list[start:start + IN_CLAUSE_CHUNK_SIZE]
+            photo_ids = missing_photo_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            cursor.execute(
+                f"DELETE FROM photos WHERE id IN ({','.join('?' * len(photo_ids))})",
+                photo_ids,
+            )
+            details['missing_files'].extend(ghost_paths)
+            yield _progress_event({'phase': 'removing_deleted', 'current': start + len(ghost_paths), 'total': missing_count})
         
         db_connection.commit()
         print(f"  ✓ Removed {missing_count} missing files")
@@ -185,59 +524,60 @@ def synchronize_library_generator(library_path, db_connection,
     if untracked_count > 0:
         print(f"\n📝 Adding {untracked_count} untracked files (with hash caching)...")
         
-        for idx, mole_path in enumerate(untracked_files_list, 1):
-            yield f"event: progress\ndata: {json.dumps({'phase': 'adding_untracked', 'current': idx, 'total': untracked_count})}\n\n"
+        probed_files = _iter_probed_untracked_files(
+            library_path,
+            untracked_files_list,
+            hash_cache,
+            get_image_dimensions_func,
+        )
+        pending_rows = []
+        last_progress_at = 0.0
+        for idx, (mole_path, cache_key, cache_hit, future) in enumerate(probed_files, 1):
+            if _progress_due(idx, untracked_count, last_progress_at):
+                last_progress_at = time.monotonic()
+                yield _progress_event({'phase': 'adding_untracked', 'current': idx, 'total': untracked_count})
+            if len(pending_rows) >= UNTRACKED_COMMIT_BATCH:
+                details['untracked_files'].extend(
+                    _insert_untracked_rows(db_connection, pending_rows)
+                )
+                db_connection.commit()
+                pending_rows = []
             
             try:
-                full_path = os.path.join(library_path, mole_path)
                 filename = os.path.basename(mole_path)
                 ext = os.path.splitext(filename)[1].lower()
                 file_type = media_kind_for_extension(ext)
                 if file_type is None:
                     continue
-                file_size = os.path.getsize(full_path)
                 
-                # Compute hash with caching
-                content_hash, cache_hit = hash_cache.get_hash(full_path)
+                if future is None:
+                    print(f"  ⚠️  Failed to hash {mole_path}")
+                    continue
+                probed = future.result()
+                content_hash = probed['content_hash']
                 if cache_hit:
                     print(f"  {idx}/{untracked_count}. {filename} (hash from cache)")
                 else:
+                    hash_cache.remember(cache_key, content_hash, commit=False)
                     print(f"  {idx}/{untracked_count}. {filename} (computed hash)")
                 
-                if content_hash is None:
-                    print(f"  ⚠️  Failed to hash {mole_path}")
-                    continue
-                
-                # Resolve date via shared read rulebook (no ingest-only mtime fallback)
-                date_taken = read_media_date(full_path, allow_mtime_fallback=False)
-                
-                # Get dimensions
-                dimensions = get_image_dimensions_func(full_path)
-                width = dimensions[0] if dimensions else None
-                height = dimensions[1] if dimensions else None
-                
-                from photo_catalog import insert_photo_row
-
-                row_id = insert_photo_row(
-                    db_connection,
-                    {
-                        "content_hash": content_hash,
-                        "current_path": mole_path,
-                        "original_filename": filename,
-                        "date_taken": date_taken,
-                        "file_size": file_size,
-                        "file_type": file_type,
-                        "width": width,
-                        "height": height,
-                    },
-                    ignore_conflicts=True,
-                )
-                if row_id:
-                    details['untracked_files'].append(mole_path)
+                pending_rows.append({
+                    "content_hash": content_hash,
+                    "current_path": mole_path,
+                    "original_filename": filename,
+                    "date_taken": probed['date_taken'],
+                    "file_size": probed['file_size'],
+                    "file_type": file_type,
+                    "width": probed['width'],
+                    "height": probed['height'],
+                })
             except Exception as e:
                 print(f"  ⚠️  Failed to index {mole_path}: {e}")
                 continue
         
+        details['untracked_files'].extend(
+            _insert_untracked_rows(db_connection, pending_rows)
+        )
         db_connection.commit()
         print(f"  ✓ Added {len(details['untracked_files'])} untracked files")
         
@@ -245,52 +585,26 @@ def synchronize_library_generator(library_path, db_connection,
         cache_stats = hash_cache.get_stats()
         print(f"  📊 Cache stats: {cache_stats['hit_rate']}% hit rate ({cache_stats['memory_hits']} memory, {cache_stats['db_hits']} DB, {cache_stats['misses']} misses)")
     
-    # Phase 3: Remove empty folders (loop until no more found - domino effect)
+    # Phase 3: Remove empty folders. Folders come from the Phase 0 scan,
+    # children before parents, so emptying a leaf lets its parent go in the
+    # same pass (domino effect).
     print(f"\n🗑️  Removing empty folders...")
     empty_count = 0
-    total_passes = 0
+    last_progress_at = 0.0
     
-    while True:
-        total_passes += 1
-        found_this_pass = 0
-        
-        for root, dirs, files in os.walk(library_path, topdown=False):
-            if os.path.basename(root).startswith('.') or root == library_path:
-                continue
-            try:
-                entries = os.listdir(root)
-                non_hidden = [e for e in entries if not e.startswith('.')]
-                if len(non_hidden) == 0:
-                    # Remove any hidden files first (like .DS_Store)
-                    for entry in entries:
-                        if entry.startswith('.'):
-                            try:
-                                entry_path = os.path.join(root, entry)
-                                if os.path.isfile(entry_path):
-                                    os.remove(entry_path)
-                            except:
-                                pass
-                    
-                    # Now remove the directory
-                    rel_path = os.path.relpath(root, library_path)
-                    os.rmdir(root)
-                    empty_count += 1
-                    found_this_pass += 1
-                    details['empty_folders'].append(rel_path)
-                    yield f"event: progress\ndata: {json.dumps({'phase': 'removing_empty', 'current': empty_count})}\n\n"
-            except Exception as e:
-                continue
-        
-        # If no empties found this pass, we're done
-        if found_this_pass == 0:
-            break
-            
-        # Safety: max 10 passes (shouldn't need more than folder depth)
-        if total_passes >= 10:
-            print(f"  ⚠️  Stopped after 10 passes (safety limit)")
-            break
+    for rel_path in reversed(library_scan.folders):
+        root = os.path.join(library_path, rel_path)
+        try:
+            if _remove_folder_if_empty(root):
+                empty_count += 1
+                details['empty_folders'].append(rel_path)
+                if _progress_due(empty_count, None, last_progress_at):
+                    last_progress_at = time.monotonic()
+                    yield _progress_event({'phase': 'removing_empty', 'current': empty_count})
+        except Exception as e:
+            continue
     
-    print(f"  ✓ Removed {empty_count} empty folders in {total_passes} passes")
+    print(f"  ✓ Removed {empty_count} empty folders")
     
     # Send completion with stats and details
     stats = {
@@ -40,7 +40,6 @@ from rotation_utils import (
 )
 from library_cleanliness import (
     ALL_MEDIA_EXTENSIONS,
-    CANONICAL_DB_DATE_FORMAT,
     PHOTO_MEDIA_EXTENSIONS,
     VIDEO_MEDIA_EXTENSIONS,
     IGNORED_LIBRARY_FILES,
@@ -52,6 +51,7 @@ from library_cleanliness import (
     is_year_folder_name,
     is_zip_artifact_name,
     media_kind_for_extension,
+    parse_canonical_db_date,
     parse_metadata_datetime,
     path_parts,
     root_entry_allowed,
@@ -489,7 +489,7 @@ def _compute_audit_media_identity(
         raise RuntimeError(f"Missing audit hash for {full_path}")
 
     date_taken = read_media_date(full_path, allow_mtime_fallback=False)
-    date_obj = datetime.strptime(date_taken, CANONICAL_DB_DATE_FORMAT)
+    date_obj = parse_canonical_db_date(date_taken)
     return AuditMediaIdentity(
         canonical_hash=current_hash,
         duplicate_key=current_hash,
@@ -1734,7 +1734,7 @@ class LibraryCleaner:
     def _parse_db_date_taken(self, date_taken: str) -> datetime:
         if date_taken == UNKNOWN_PHOTO_DATE_TAKEN:
             return datetime(1900, 1, 1, 0, 0, 0)
-        return datetime.strptime(date_taken, CANONICAL_DB_DATE_FORMAT)
+        return parse_canonical_db_date(date_taken)
 
     def _needs_metadata_work(self, full_path: str, ext: str) -> bool:
         return file_needs_metadata_compliance(
@@ -37,9 +37,13 @@ Write policy (``metadata_write_policy`` / ``write_and_verify_media_date``)
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
+import select
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal, Optional
@@ -50,6 +54,7 @@ from library_cleanliness import (
     PHOTO_MEDIA_EXTENSIONS,
     SUPPORTED_METADATA_DATE_FORMATS,
     VIDEO_MEDIA_EXTENSIONS,
+    parse_canonical_db_date,
 )
 
 UNKNOWN_PHOTO_DATE_TAKEN = "1900:01:01 00:00:00"
@@ -66,6 +71,11 @@ UNSUPPORTED_VIDEO_DATE_FORMATS = {
 QUICKTIME_ATOM_EXTENSIONS = {".mov", ".qt", ".mp4", ".m4v"}
 EXIFTOOL_VIDEO_FALLBACK_EXTENSIONS = {".mkv", ".webm", ".flv", ".3gp"}
 
+# Idle ``exiftool -stay_open`` processes kept for photo date reads. Concurrent
+# readers beyond this start their own and close it when done.
+EXIFTOOL_SESSION_POOL_SIZE = 4
+EXIFTOOL_READY_MARKER = b"{ready}\n"
+
 
 class MediaDateError(Exception):
     """Base class for explicit media date policy failures."""
@@ -93,7 +103,19 @@ class MediaDateWritePolicy:
 
 def parse_canonical_media_date(value: str) -> datetime:
     """Parse the app canonical date string: YYYY:MM:DD HH:MM:SS."""
-    return datetime.strptime(value, CANONICAL_DB_DATE_FORMAT)
+    return parse_canonical_db_date(value)
+
+
+def format_canonical_media_date(value: datetime) -> str:
+    """Format a datetime as the app canonical date string: YYYY:MM:DD HH:MM:SS."""
+    return "%04d:%02d:%02d %02d:%02d:%02d" % (
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+    )
 
 
 def canonical_date_to_iso(value: str) -> str:
@@ -236,24 +258,116 @@ def read_video_creation_time(file_path: str) -> str | None:
     return normalize_ffprobe_creation_time(creation_time)
 
 
+class _ExiftoolSession:
+    """
+    One ``exiftool -stay_open True -@ -`` process.
+
+    Each command is written as argfile lines ending in ``-execute``; exiftool
+    answers with the command's stdout followed by ``{ready}``. Saves the Perl
+    startup (~200 ms) that a fresh ``exiftool`` pays per file.
+    """
+
+    def __init__(self) -> None:
+        self._process = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def execute(self, args: list[str], timeout: float) -> str:
+        """Run one command; raises TimeoutExpired or OSError on a dead session."""
+        lines = [os.fsencode(arg) for arg in args] + [b"-execute"]
+        self._process.stdin.write(b"\n".join(lines) + b"\n")
+        self._process.stdin.flush()
+
+        fd = self._process.stdout.fileno()
+        output = bytearray()
+        deadline = time.monotonic() + timeout
+        while not output.endswith(EXIFTOOL_READY_MARKER):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(args, timeout)
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise OSError("exiftool session exited")
+            output += chunk
+        return output[: -len(EXIFTOOL_READY_MARKER)].decode("utf-8", "replace")
+
+    def close(self) -> None:
+        try:
+            self._process.stdin.write(b"-stay_open\nFalse\n")
+            self._process.stdin.close()
+            self._process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+
+
+_exiftool_sessions: "queue.LifoQueue[_ExiftoolSession]" = queue.LifoQueue(
+    maxsize=EXIFTOOL_SESSION_POOL_SIZE
+)
+
+
+def _close_idle_exiftool_sessions() -> None:
+    while True:
+        try:
+            _exiftool_sessions.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+atexit.register(_close_idle_exiftool_sessions)
+
+
+def _run_exiftool_read(args: list[str], *, timeout: float = 30) -> str:
+    """Run a read-only exiftool command on a pooled ``-stay_open`` session."""
+    if any("\n" in arg or arg != arg.strip() for arg in args):
+        # Argfile lines are one argument each, with surrounding spaces trimmed.
+        return subprocess.run(
+            ["exiftool", *args], capture_output=True, text=True, timeout=timeout,
+        ).stdout
+
+    try:
+        session = _exiftool_sessions.get_nowait()
+        pooled = True
+    except queue.Empty:
+        session = _ExiftoolSession()
+        pooled = False
+    try:
+        output = session.execute(args, timeout)
+    except OSError:
+        session.close()
+        if not pooled:
+            raise
+        # An idle pooled process may have died; retry once on a fresh one.
+        session = _ExiftoolSession()
+        try:
+            output = session.execute(args, timeout)
+        except BaseException:
+            session.close()
+            raise
+    except BaseException:
+        session.close()
+        raise
+    try:
+        _exiftool_sessions.put_nowait(session)
+    except queue.Full:
+        session.close()
+    return output
+
+
 def _read_embedded_photo_date(file_path: str) -> Optional[str]:
-    result = subprocess.run(
-        [
-            "exiftool",
-            "-DateTimeOriginal",
-            "-CreateDate",
-            "-ModifyDate",
-            "-j",
-            file_path,
-        ],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    if result.returncode != 0:
+    try:
+        stdout = _run_exiftool_read(
+            ["-DateTimeOriginal", "-CreateDate", "-ModifyDate", "-j", file_path]
+        )
+    except OSError:
+        # exiftool missing or exited mid-command (was a non-zero exit before).
         return None
-
-    payload = json.loads(result.stdout or "[]")
+    payload = json.loads(stdout or "[]")
     if not payload:
         return None
     data = payload[0]
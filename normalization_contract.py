@@ -14,8 +14,7 @@ from enum import Enum
 from typing import Callable, Optional
 
 from hash_cache import compute_hash_legacy
-from library_cleanliness import CANONICAL_DB_DATE_FORMAT, canonical_relative_path
-from datetime import datetime
+from library_cleanliness import canonical_relative_path, parse_canonical_db_date
 
 
 class NormalizationMode(str, Enum):
@@ -104,7 +103,7 @@ def expected_canonical_rel_path_from_db_date(
     content_hash: str,
     ext: str,
 ) -> str:
-    date_obj = datetime.strptime(date_taken, CANONICAL_DB_DATE_FORMAT)
+    date_obj = parse_canonical_db_date(date_taken)
     return canonical_relative_path(date_obj, content_hash, ext)
 
 
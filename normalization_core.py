@@ -10,11 +10,11 @@ from __future__ import annotations
 
 import os
 import shutil
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional, Tuple
 
 from library_cleanliness import (
-    VIDEO_MEDIA_EXTENSIONS,
     build_canonical_photo_path,
     media_kind_for_extension,
 )
@@ -62,7 +62,7 @@ class NormalizationIdentity:
 
 def classify_media_kind(ext: str) -> Optional[str]:
     """Return the shared media kind for an extension."""
-    return media_kind_for_extension(ext.lower())
+    return media_kind_for_extension(ext)
 
 
 def duplicate_row_for_hash(conn, content_hash: str):
@@ -112,10 +112,28 @@ def build_video_identity(
     )
 
 
+def _file_state(path: str) -> Tuple[int, int, int]:
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
 def expected_canonical_rel_path(date_taken: str, content_hash: str, ext: str) -> str:
     return expected_canonical_rel_path_from_db_date(date_taken, content_hash, ext)
 
 
+def stage_ingest_photo(
+    source_path: str,
+    *,
+    deps: NormalizationCoreDependencies,
+    temp_prefix: str = "import_photo_",
+):
+    """Copy and canonicalize one photo into import temp; touches no DB state."""
+    return deps.stage_photo_for_canonicalization(
+        source_path,
+        temp_prefix=temp_prefix,
+    )
+
+
 def normalize_ingest_photo(
     conn,
     source_path: str,
@@ -123,13 +141,20 @@ def normalize_ingest_photo(
     filename: str,
     deps: NormalizationCoreDependencies,
     temp_prefix: str = "import_photo_",
+    prestaged: Optional[Future] = None,
 ) -> NormalizationFileResult:
+    """
+    Stage, dedupe, and commit one photo.
+
+    ``prestaged`` is a Future of ``stage_ingest_photo`` already submitted by the
+    caller; a staging failure it holds is reported like an inline one.
+    """
     staged_path = None
     try:
-        staged_photo = deps.stage_photo_for_canonicalization(
-            source_path,
-            temp_prefix=temp_prefix,
-        )
+        if prestaged is not None:
+            staged_photo = prestaged.result()
+        else:
+            staged_photo = stage_ingest_photo(source_path, deps=deps, temp_prefix=temp_prefix)
         staged_path = staged_photo.staged_path
         canonical_photo = staged_photo.canonical_photo
 
@@ -221,7 +246,13 @@ def normalize_ingest_video(
     shutil.copy2(source_path, target_path)
 
     try:
+        copied_stat = _file_state(target_path)
         deps.write_video_metadata(target_path, identity.date_taken)
+        # The source hash already describes the copied bytes unless the metadata
+        # write touched the file, so skip re-reading the whole video in that case.
+        precomputed_hash = (
+            identity.content_hash if _file_state(target_path) == copied_stat else None
+        )
         finalize_result = deps.finalize_mutated_media(
             conn=conn,
             photo_id=photo_id,
@@ -234,6 +265,7 @@ def normalize_ingest_video(
             get_dimensions=deps.get_dimensions,
             delete_thumbnail_for_hash=deps.delete_thumbnail_for_hash,
             duplicate_policy="delete",
+            precomputed_hash=precomputed_hash,
         )
         conn.commit()
         if finalize_result.status == "duplicate_removed":
@@ -274,12 +306,19 @@ def normalize_ingest_file(
     *,
     filename: str,
     deps: NormalizationCoreDependencies,
+    prestaged: Optional[Future] = None,
 ) -> NormalizationFileResult:
     _base, ext = os.path.splitext(filename)
     kind = classify_media_kind(ext)
     if kind == "photo":
-        return normalize_ingest_photo(conn, source_path, filename=filename, deps=deps)
-    if ext.lower() in VIDEO_MEDIA_EXTENSIONS:
+        return normalize_ingest_photo(
+            conn,
+            source_path,
+            filename=filename,
+            deps=deps,
+            prestaged=prestaged,
+        )
+    if kind == "video":
         return normalize_ingest_video(
             conn,
             source_path,
@@ -8,6 +8,7 @@ ingest API while app.py remains responsible for HTTP/SSE and import-specific UX.
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
@@ -15,9 +16,17 @@ from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 from normalization_core import (
     NormalizationCoreDependencies,
     NormalizationFileResult,
+    classify_media_kind,
     normalize_ingest_file,
+    stage_ingest_photo,
 )
 
+# Photos are staged (copy, exiftool, orientation bake, hash) this many files
+# ahead of the commit loop on a small pool; staging only touches the staged
+# temp file, while duplicate checks, moves and inserts stay serial on ``conn``.
+INGEST_STAGING_WORKERS = min(4, os.cpu_count() or 1)
+INGEST_STAGING_LOOKAHEAD = 2 * INGEST_STAGING_WORKERS
+
 
 @dataclass
 class IngestDependencies(NormalizationCoreDependencies):
@@ -73,81 +82,120 @@ def iter_ingest_events(
     start_entry = _log("start", {"total": total})
     yield "log", {"entry": start_entry}
 
-    for file_index, source_path in enumerate(paths, 1):
-        if stop_check and stop_check():
-            return
+    prestaged: Dict[int, Future] = {}
+    next_to_stage = 0
 
-        filename = os.path.basename(source_path)
-        if not os.path.exists(source_path):
-            counters.errors += 1
-            missing_entry = _log("missing_file", {"file": source_path})
-            yield "log", {"entry": missing_entry}
-            yield "progress", counters.progress_payload(current=file_index, total=total)
-            continue
+    def _stage_ahead(executor: ThreadPoolExecutor, upto: int) -> None:
+        nonlocal next_to_stage
+        while next_to_stage < min(upto, total):
+            path = paths[next_to_stage]
+            if classify_media_kind(os.path.splitext(path)[1]) == "photo" and os.path.isfile(path):
+                prestaged[next_to_stage] = executor.submit(stage_ingest_photo, path, deps=deps)
+            next_to_stage += 1
 
+    def _discard_staged(future: Optional[Future]) -> None:
+        if future is None or future.cancel():
+            return
         try:
-            result = normalize_ingest_file(conn, source_path, filename=filename, deps=deps)
-
-            if result.status == "imported":
-                counters.imported += 1
-                payload = counters.progress_payload(current=file_index, total=total)
-                if result.photo_id:
-                    payload["photo_id"] = result.photo_id
-                imported_entry = _log(
-                    "imported",
-                    {"file": source_path, "photo_id": result.photo_id},
-                )
-                yield "log", {"entry": imported_entry}
-                yield "progress", payload
-            elif result.status == "duplicate":
-                counters.duplicates += 1
-                duplicate_entry = _log("duplicate", {"file": source_path})
-                yield "log", {"entry": duplicate_entry}
-                yield "progress", counters.progress_payload(current=file_index, total=total)
-            elif result.status == "rejected":
-                rejection = dict(result.rejection or {})
-                category = rejection.get("category")
-                if category == "duplicate":
-                    counters.duplicates += 1
-                else:
+            staged_photo = future.result()
+        except Exception:
+            # A failed stage already removed its own temp file.
+            return
+        deps.cleanup_staged_file(staged_photo.staged_path)
+
+    with ThreadPoolExecutor(
+        max_workers=INGEST_STAGING_WORKERS,
+        thread_name_prefix="ingest-stage",
+    ) as executor:
+        try:
+            for file_index, source_path in enumerate(paths, 1):
+                if stop_check and stop_check():
+                    return
+
+                _stage_ahead(executor, file_index + INGEST_STAGING_LOOKAHEAD)
+                staged = prestaged.pop(file_index - 1, None)
+                filename = os.path.basename(source_path)
+                if not os.path.exists(source_path):
+                    _discard_staged(staged)
+                    counters.errors += 1
+                    missing_entry = _log("missing_file", {"file": source_path})
+                    yield "log", {"entry": missing_entry}
+                    yield "progress", counters.progress_payload(current=file_index, total=total)
+                    continue
+
+                try:
+                    result = normalize_ingest_file(
+                        conn,
+                        source_path,
+                        filename=filename,
+                        deps=deps,
+                        prestaged=staged,
+                    )
+
+                    if result.status == "imported":
+                        counters.imported += 1
+                        payload = counters.progress_payload(current=file_index, total=total)
+                        if result.photo_id:
+                            payload["photo_id"] = result.photo_id
+                        imported_entry = _log(
+                            "imported",
+                            {"file": source_path, "photo_id": result.photo_id},
+                        )
+                        yield "log", {"entry": imported_entry}
+                        yield "progress", payload
+                    elif result.status == "duplicate":
+                        counters.duplicates += 1
+                        duplicate_entry = _log("duplicate", {"file": source_path})
+                        yield "log", {"entry": duplicate_entry}
+                        yield "progress", counters.progress_payload(current=file_index, total=total)
+                    elif result.status == "rejected":
+                        rejection = dict(result.rejection or {})
+                        category = rejection.get("category")
+                        if category == "duplicate":
+                            counters.duplicates += 1
+                        else:
+                            counters.errors += 1
+                        rejected_entry = _log(
+                            "rejected",
+                            {
+                                "file": rejection.get("file") or source_path,
+                                "reason": rejection.get("reason"),
+                                "category": category,
+                            },
+                        )
+                        yield "log", {"entry": rejected_entry}
+                        rejection.update(counters.progress_payload(current=file_index, total=total))
+                        yield "rejected", rejection
+                    else:
+                        counters.errors += 1
+                        error_entry = _log(
+                            "error",
+                            {
+                                "file": result.error_file or source_path,
+                                "message": result.error,
+                            },
+                        )
+                        yield "log", {"entry": error_entry}
+                        yield "progress", counters.progress_payload(
+                            current=file_index,
+                            total=total,
+                            error=result.error,
+                            error_file=result.error_file or filename,
+                        )
+                except Exception as error:
                     counters.errors += 1
-                rejected_entry = _log(
-                    "rejected",
-                    {
-                        "file": rejection.get("file") or source_path,
-                        "reason": rejection.get("reason"),
-                        "category": category,
-                    },
-                )
-                yield "log", {"entry": rejected_entry}
-                rejection.update(counters.progress_payload(current=file_index, total=total))
-                yield "rejected", rejection
-            else:
-                counters.errors += 1
-                error_entry = _log(
-                    "error",
-                    {
-                        "file": result.error_file or source_path,
-                        "message": result.error,
-                    },
-                )
-                yield "log", {"entry": error_entry}
-                yield "progress", counters.progress_payload(
-                    current=file_index,
-                    total=total,
-                    error=result.error,
-                    error_file=result.error_file or filename,
-                )
-        except Exception as error:
-            counters.errors += 1
-            error_entry = _log("error", {"file": source_path, "message": str(error)})
-            yield "log", {"entry": error_entry}
-            yield "progress", counters.progress_payload(
-                current=file_index,
-                total=total,
-                error=str(error),
-                error_file=filename,
-            )
+                    error_entry = _log("error", {"file": source_path, "message": str(error)})
+                    yield "log", {"entry": error_entry}
+                    yield "progress", counters.progress_payload(
+                        current=file_index,
+                        total=total,
+                        error=str(error),
+                        error_file=filename,
+                    )
+        finally:
+            for future in prestaged.values():
+                _discard_staged(future)
+            prestaged.clear()
 
     complete_payload = {
         "imported": counters.imported,
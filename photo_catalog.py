@@ -5,7 +5,7 @@ Canonical photo catalog insert and import-date preservation helpers.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 
 STANDARD_INSERT_FIELDS = (
     "original_filename",
@@ -19,6 +19,30 @@ STANDARD_INSERT_FIELDS = (
 )
 OPTIONAL_INSERT_FIELDS = ("rating",)
 
+# Ids bound per IN (...) lookup; stays well under SQLite's 999 host-parameter default.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def iter_rows_for_ids(
+    cursor,
+    sql_template: str,
+    ids: Iterable[Any],
+    *,
+    params: Sequence[Any] = (),
+    chunk_size: int = IN_CLAUSE_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Yield rows from sql_template run once per chunk of ids.
+
+    sql_template has a ``{placeholders}`` slot for the IN (...) list; params
+    bind ahead of each chunk's ids.
+    """
+    id_list = list(ids)
+    for start in range(0, len(id_list), chunk_size):
+        chunk = id_list[start:start + chunk_size]
+        sql = sql_template.format(placeholders=",".join("?" * len(chunk)))
+        yield from cursor.execute(sql, (*params, *chunk)).fetchall()
+
 
 def catalog_now_utc_iso() -> str:
     """Return current UTC time as consistent ISO text."""
@@ -60,6 +84,39 @@ def insert_photo_row(
     return cursor.lastrowid
 
 
+def insert_photo_rows(
+    conn,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    ignore_conflicts: bool = False,
+) -> int:
+    """
+    Insert new photos rows that all carry the same fields, in one executemany.
+
+    Every row gets date_added = now. Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+
+    columns = [
+        column
+        for column in (*STANDARD_INSERT_FIELDS, *OPTIONAL_INSERT_FIELDS)
+        if column in rows[0]
+    ]
+    date_added = catalog_now_utc_iso()
+
+    verb = "INSERT OR IGNORE" if ignore_conflicts else "INSERT"
+    placeholders = ", ".join(["?"] * (len(columns) + 1))
+    sql = f"{verb} INTO photos ({', '.join(columns)}, date_added) VALUES ({placeholders})"
+
+    cursor = conn.cursor()
+    cursor.executemany(
+        sql,
+        ([row[column] for column in columns] + [date_added] for row in rows),
+    )
+    return cursor.rowcount
+
+
 def snapshot_date_added_maps(cursor) -> Tuple[Dict[str, str], Dict[str, str]]:
     """Snapshot import dates keyed by content_hash and current_path before rebuild."""
     rows = cursor.execute(
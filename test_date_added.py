@@ -10,7 +10,7 @@ from unittest.mock import patch
 import app as photo_app
 from db_schema import create_database_schema
 from make_library_clean_v2 import DBNormalizationEngine, MediaRecord
-from photo_catalog import insert_photo_row
+from photo_catalog import insert_photo_row, iter_rows_for_ids
 from trash_catalog import restore_or_merge_deleted_photo
 
 
@@ -76,6 +76,32 @@ class DateAddedInsertTest(unittest.TestCase):
             self.assertEqual(row["date_added"], "2025-01-01T08:00:00+00:00")
 
 
+class CatalogIdLookupTest(unittest.TestCase):
+    def test_iter_rows_for_ids_chunks_in_lists_and_binds_leading_params(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, kind TEXT)")
+        conn.executemany(
+            "INSERT INTO t (id, kind) VALUES (?, ?)",
+            [(index, "keep" if index % 2 else "skip") for index in range(1, 8)],
+        )
+        statements = []
+        conn.set_trace_callback(statements.append)
+
+        rows = list(
+            iter_rows_for_ids(
+                conn.cursor(),
+                "SELECT id FROM t WHERE kind = ? AND id IN ({placeholders})",
+                [1, 2, 3, 5, 7, 99],
+                params=("keep",),
+                chunk_size=4,
+            )
+        )
+
+        self.assertEqual(sorted(row[0] for row in rows), [1, 3, 5, 7])
+        self.assertEqual(len([sql for sql in statements if sql.startswith("SELECT")]), 2)
+        conn.close()
+
+
 class DateAddedRebuildTest(unittest.TestCase):
     def test_rebuild_preserves_existing_date_added(self):
         with TemporaryDirectory() as tmpdir:
@@ -274,6 +300,39 @@ class DateAddedApiSortTest(unittest.TestCase):
         self.assertNotEqual(recent_ids, newest_ids)
         self.assertEqual(recent["sort"], "recently_added")
 
+    def test_unlimited_grid_matches_paged_rows(self):
+        conn = sqlite3.connect(self.db_path)
+        for name, path, date_taken, content_hash in (
+            ("unknown.jpg", "2019/2019-03-04/unknown.jpg", "1900:01:01 00:00:00", "c" * 64),
+            ("undated.jpg", "undated/undated.jpg", None, "d" * 64),
+        ):
+            insert_photo_row(
+                conn,
+                {
+                    "original_filename": name,
+                    "current_path": path,
+                    "date_taken": date_taken,
+                    "content_hash": content_hash,
+                    "file_size": 10,
+                    "file_type": "photo",
+                    "width": 10,
+                    "height": 10,
+                },
+            )
+        conn.commit()
+        conn.close()
+
+        client = photo_app.app.test_client()
+        for sort_order in ("newest", "oldest"):
+            full = client.get(f"/api/photos?sort={sort_order}").get_json()
+            paged = client.get(f"/api/photos?limit=10&sort={sort_order}").get_json()
+
+            self.assertEqual(full["count"], 4)
+            self.assertEqual(full["photos"], paged["photos"])
+        months = {photo["path"]: photo["month"] for photo in full["photos"]}
+        self.assertEqual(months["2019/2019-03-04/unknown.jpg"], "2019-03")
+        self.assertEqual(months["undated/undated.jpg"], "undated")
+
     def test_import_sets_limits_to_top_import_months(self):
         client = photo_app.app.test_client()
         payload = client.get(
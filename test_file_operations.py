@@ -0,0 +1,33 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from PIL import Image
+
+from file_operations import get_dimensions
+
+
+class GetDimensionsTest(unittest.TestCase):
+    def test_reports_display_size_after_exif_orientation(self):
+        with TemporaryDirectory() as tmpdir:
+            cases = ((1, (600, 400)), (3, (600, 400)), (6, (400, 600)), (8, (400, 600)))
+            for orientation, expected in cases:
+                with self.subTest(orientation=orientation):
+                    path = os.path.join(tmpdir, f"o{orientation}.jpg")
+                    exif = Image.Exif()
+                    exif[0x0112] = orientation
+                    Image.new("RGB", (600, 400)).save(path, exif=exif.tobytes())
+
+                    self.assertEqual(tuple(get_dimensions(path)), expected)
+
+    def test_unreadable_file_returns_none_pair(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "broken.jpg")
+            with open(path, "wb") as handle:
+                handle.write(b"not an image")
+
+            self.assertEqual(get_dimensions(path), (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
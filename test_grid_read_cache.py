@@ -6,6 +6,7 @@ from urllib.parse import quote
 from unittest.mock import patch
 
 import app as photo_app
+from db_schema import create_database_schema
 from media_finalization import FinalizeMediaResult
 
 
@@ -109,6 +110,68 @@ class GridReadCacheTest(unittest.TestCase):
             {"1920-01": 1, "1900-01": 1},
         )
 
+    def test_years_cache_serves_stale_data_until_invalidated(self):
+        first = self.client.get("/api/years").get_json()
+        self.assertEqual(first["years"], [1900])
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            INSERT INTO photos (
+                original_filename, current_path, date_taken, content_hash,
+                file_size, file_type, width, height, rating
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                "y.jpg",
+                "1930/1930-05-01/y.jpg",
+                "1930:05:01 00:00:00",
+                "hashyyyyyyyyyyyyyyyyyyyyyyyyyyyy",
+                100,
+                "photo",
+                1,
+                1,
+                None,
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        stale = self.client.get("/api/years").get_json()
+        self.assertEqual(stale["years"], [1900])
+
+        photo_app.invalidate_grid_read_caches()
+        fresh = self.client.get("/api/years").get_json()
+        self.assertEqual(sorted(fresh["years"]), [1900, 1930])
+
+    def test_nearest_month_prefers_target_year_then_closest_month(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            """
+            INSERT INTO photos (
+                original_filename, current_path, date_taken, content_hash,
+                file_size, file_type, width, height, rating
+            ) VALUES (?, ?, ?, ?, 100, 'photo', 1, 1, NULL)
+            """,
+            [
+                ("m.jpg", "1920/1920-03-01/m.jpg", "1920:03:01 00:00:00", "hashmarch"),
+                ("n.jpg", "1920/1920-08-01/n.jpg", "1920:08:01 00:00:00", "hashaugust"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        def nearest(month, sort):
+            response = self.client.get(f"/api/photos/nearest_month?month={month}&sort={sort}")
+            return response.get_json()["nearest_month"]
+
+        self.assertEqual(nearest("1920-05", "newest"), "1920-08")
+        self.assertEqual(nearest("1920-05", "oldest"), "1920-03")
+        self.assertEqual(nearest("1920-10", "newest"), "1920-08")
+        self.assertEqual(nearest("1920-01", "oldest"), "1920-03")
+        self.assertEqual(nearest("1925-01", "newest"), "1920-08")
+        self.assertEqual(nearest("1910-01", "newest"), "1900-01")
+
     def test_invalidate_grid_read_caches_clears_total_count(self):
         first_total = self.client.get("/api/photos?sort=newest&limit=1").get_json()["total"]
         self.assertEqual(first_total, 1)
@@ -579,6 +642,59 @@ class GridReadCacheTest(unittest.TestCase):
         self.assertEqual(payload["photos"][0]["path"], "2026/2026-01-01/newer.jpg")
         self.assertEqual(payload["photos"][1]["path"], "1900/1900-01-01/older.jpg")
 
+    def test_dimensions_served_from_catalog_without_reading_file(self):
+        with patch.object(photo_app, "get_image_dimensions") as read_file:
+            payload = self.client.get("/api/photo/1/dimensions").get_json()
+
+        read_file.assert_not_called()
+        self.assertEqual(payload, {"id": 1, "width": 1, "height": 1})
+
+    def test_dimensions_missing_from_catalog_are_backfilled(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE photos SET width = NULL, height = NULL WHERE id = 1")
+        conn.commit()
+        conn.close()
+
+        with patch.object(photo_app, "get_image_dimensions", return_value=(640, 480)), \
+                patch.object(photo_app, "invalidate_grid_read_caches") as invalidate:
+            payload = self.client.get("/api/photo/1/dimensions").get_json()
+
+        self.assertEqual(payload, {"id": 1, "width": 640, "height": 480})
+        invalidate.assert_called_once_with()
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute("SELECT width, height FROM photos WHERE id = 1").fetchone()
+        conn.close()
+        self.assertEqual(row, (640, 480))
+
+
+class AnchoredMonthQueryPlanTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        create_database_schema(self.conn.cursor())
+        photo_app.invalidate_grid_read_caches()
+
+    def tearDown(self):
+        photo_app.invalidate_grid_read_caches()
+        self.conn.close()
+
+    def _keyset_plan(self, sort_order):
+        statements = []
+        self.conn.set_trace_callback(statements.append)
+        photo_app.fetch_photos_anchored_at_month(self.conn.cursor(), "1900-01", 50, sort_order)
+        self.conn.set_trace_callback(None)
+        keyset_sql = next(sql for sql in statements if "ORDER BY date_taken" in sql)
+        rows = self.conn.execute(f"EXPLAIN QUERY PLAN {keyset_sql}").fetchall()
+        return " | ".join(row[3] for row in rows)
+
+    def test_jump_keyset_query_seeks_covering_grid_index_without_sorting(self):
+        for sort_order, index_name in (("newest", "idx_grid_newest"), ("oldest", "idx_grid_oldest")):
+            with self.subTest(sort=sort_order):
+                plan = self._keyset_plan(sort_order)
+                self.assertIn("SEARCH photos USING COVERING INDEX", plan)
+                self.assertIn(index_name, plan)
+                self.assertNotIn("TEMP B-TREE", plan)
+
 
 if __name__ == "__main__":
     unittest.main()
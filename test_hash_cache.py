@@ -0,0 +1,38 @@
+import hashlib
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+
+from hash_cache import HASH_READ_CHUNK_SIZE, hash_file_sha256
+
+
+class HashFileSha256Test(unittest.TestCase):
+    def test_digest_matches_hashlib_across_chunk_boundaries(self):
+        with TemporaryDirectory() as tmpdir:
+            for size in (0, 1, HASH_READ_CHUNK_SIZE, 2 * HASH_READ_CHUNK_SIZE + 17):
+                data = os.urandom(size)
+                file_path = os.path.join(tmpdir, f"blob_{size}.bin")
+                with open(file_path, "wb") as fh:
+                    fh.write(data)
+
+                self.assertEqual(hash_file_sha256(file_path), hashlib.sha256(data).hexdigest())
+
+    def test_concurrent_hashes_do_not_share_a_read_buffer(self):
+        with TemporaryDirectory() as tmpdir:
+            expected = {}
+            for index in range(12):
+                data = os.urandom(HASH_READ_CHUNK_SIZE + index * 4099)
+                file_path = os.path.join(tmpdir, f"blob_{index}.bin")
+                with open(file_path, "wb") as fh:
+                    fh.write(data)
+                expected[file_path] = hashlib.sha256(data).hexdigest()
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                digests = dict(zip(expected, executor.map(hash_file_sha256, expected)))
+
+            self.assertEqual(digests, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@ from image_pixels import (
     bake_heic_orientation_in_place,
     open_still_image,
     preview_decode_error_message,
+    save_square_jpeg_thumbnail,
     should_decode_with_sips,
     still_image_to_jpeg_buffer,
     thumbnail_cache_filename,
@@ -176,6 +177,42 @@ class ImagePixelsDecodeTests(unittest.TestCase):
         finally:
             os.remove(temp_path)
 
+    def test_min_size_decodes_jpeg_at_reduced_scale_with_orientation(self):
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as handle:
+            temp_path = handle.name
+        try:
+            exif = Image.Exif()
+            exif[0x0112] = 6
+            Image.new("RGB", (1600, 1200), color=(10, 20, 30)).save(
+                temp_path,
+                format="JPEG",
+                exif=exif.tobytes(),
+            )
+            image = open_still_image(temp_path, min_size=300)
+            try:
+                self.assertEqual(image.size, (300, 400))
+            finally:
+                image.close()
+        finally:
+            os.remove(temp_path)
+
+    def test_square_thumbnail_keeps_only_center_crop(self):
+        image = Image.new("RGB", (1200, 400), color=(255, 0, 0))
+        image.paste((0, 255, 0), (400, 0, 800, 400))
+        image.paste((0, 0, 255), (800, 0, 1200, 400))
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as handle:
+            temp_path = handle.name
+        try:
+            save_square_jpeg_thumbnail(image, temp_path, target_size=100)
+            with Image.open(temp_path) as thumb:
+                self.assertEqual(thumb.size, (100, 100))
+                for point in ((5, 50), (50, 50), (94, 50)):
+                    red, green, blue = thumb.getpixel(point)
+                    self.assertGreater(green, 200)
+                    self.assertLess(max(red, blue), 60)
+        finally:
+            os.remove(temp_path)
+
     def test_bake_heic_orientation_strips_tag_on_macos(self):
         if sys.platform != "darwin":
             self.skipTest("sips integration test requires macOS")
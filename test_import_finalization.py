@@ -130,6 +130,33 @@ class ImportFinalizationRouteTest(unittest.TestCase):
         self.assertEqual(row["height"], 480)
         self.assertEqual(row["file_size"], len(final_bytes))
 
+    def test_import_route_writes_each_file_with_its_log_entries(self):
+        missing_paths = [
+            os.path.join(self.tmpdir.name, f"missing_{index}.jpg")
+            for index in range(5)
+        ]
+        response = self.client.post(
+            "/api/photos/import-from-paths",
+            json={"paths": missing_paths},
+            buffered=False,
+        )
+        chunks = [
+            chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+            for chunk in response.response
+        ]
+        response.close()
+
+        stream = "".join(chunks)
+        self.assertEqual(stream.count("event: progress"), len(missing_paths))
+        self.assertIn('"errors": 5', stream.split("event: complete", 1)[1])
+        self.assertLess(len(chunks), stream.count("event: "))
+        progress_chunks = [chunk for chunk in chunks if "event: progress" in chunk]
+        self.assertEqual(len(progress_chunks), len(missing_paths))
+        for chunk in progress_chunks:
+            self.assertEqual(chunk.count("event: progress"), 1)
+            self.assertTrue(chunk.rsplit("event: ", 1)[1].startswith("progress"))
+        self.assertIn("event: complete", chunks[-1])
+
 
 if __name__ == "__main__":
     unittest.main()
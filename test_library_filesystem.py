@@ -1,3 +1,4 @@
+import errno
 import os
 import sqlite3
 import unittest
@@ -10,6 +11,7 @@ from library_filesystem import (
     ensure_blocking_audit_prep,
     finalize_library_layout,
     iter_library_walk,
+    move_file,
     move_file_to_category_trash,
     partition_library_files,
     prune_empty_year_subfolders,
@@ -228,6 +230,29 @@ class LibraryFilesystemTest(unittest.TestCase):
                 os.path.join(trash_dir, "errors", "incoming", "notes.txt"),
             )
 
+    def test_move_file_falls_back_to_copy_across_filesystems(self):
+        with TemporaryDirectory() as tmpdir:
+            source_path = os.path.join(tmpdir, "source.jpg")
+            target_path = os.path.join(tmpdir, "target.jpg")
+            with open(source_path, "wb") as handle:
+                handle.write(b"photo")
+
+            cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("library_filesystem.os.replace", side_effect=cross_device):
+                move_file(source_path, target_path)
+
+            self.assertFalse(os.path.exists(source_path))
+            with open(target_path, "rb") as handle:
+                self.assertEqual(handle.read(), b"photo")
+
+    def test_move_file_propagates_non_cross_device_errors(self):
+        with TemporaryDirectory() as tmpdir:
+            with self.assertRaises(FileNotFoundError):
+                move_file(
+                    os.path.join(tmpdir, "missing.jpg"),
+                    os.path.join(tmpdir, "target.jpg"),
+                )
+
     def test_ensure_blocking_audit_prep_quarantines_metadata_and_trashes_orphans(self):
         with TemporaryDirectory() as tmpdir:
             db_path = canonical_db_path(tmpdir)
@@ -1,8 +1,22 @@
+import hashlib
 import os
+import sqlite3
 import unittest
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
-from library_sync import count_media_files, count_media_files_by_type
+import app as photo_app
+from db_schema import create_database_schema
+from library_sync import (
+    _diff_sorted_paths,
+    _insert_untracked_rows,
+    count_media_files,
+    count_media_files_by_type,
+    iter_visible_media_entries,
+    scan_library,
+    synchronize_library_generator,
+    take_recent_library_scan,
+)
 
 
 class LibrarySyncMediaCountingTest(unittest.TestCase):
@@ -28,6 +42,267 @@ class LibrarySyncMediaCountingTest(unittest.TestCase):
                 {"photo_count": 1, "video_count": 1, "total_count": 2},
             )
 
+    def test_scan_collects_every_year_subtree_with_parents_first(self):
+        with TemporaryDirectory() as tmpdir:
+            expected_media = {"root.jpg"}
+            for year in ("2023", "2024", "2025"):
+                for day in ("01", "02"):
+                    rel_dir = os.path.join(year, f"{year}-01-{day}")
+                    os.makedirs(os.path.join(tmpdir, rel_dir))
+                    rel_path = os.path.join(rel_dir, "img.jpg")
+                    expected_media.add(rel_path)
+                    with open(os.path.join(tmpdir, rel_path), "wb") as fh:
+                        fh.write(b"photo")
+            with open(os.path.join(tmpdir, "root.jpg"), "wb") as fh:
+                fh.write(b"photo")
+
+            scan = scan_library(tmpdir)
+
+            self.assertEqual(set(scan.media_paths), expected_media)
+            self.assertEqual(len(scan.folders), 9)
+            for index, folder in enumerate(scan.folders):
+                parent = os.path.dirname(folder)
+                if parent:
+                    self.assertLess(scan.folders.index(parent), index)
+
+    def test_recent_scan_is_reused_once_while_library_root_is_unchanged(self):
+        with TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "photo.jpg"), "wb") as fh:
+                fh.write(b"photo")
+
+            scan = scan_library(tmpdir)
+
+            self.assertIs(take_recent_library_scan(tmpdir), scan)
+            self.assertIsNone(take_recent_library_scan(tmpdir))
+
+            scan_library(tmpdir)
+            os.makedirs(os.path.join(tmpdir, "2026"))
+            os.utime(tmpdir, ns=(0, 0))
+            self.assertIsNone(take_recent_library_scan(tmpdir))
+
+    def test_recent_scan_cache_keeps_only_the_latest_library(self):
+        with TemporaryDirectory() as first, TemporaryDirectory() as second:
+            scan_library(first)
+            second_scan = scan_library(second)
+
+            self.assertIsNone(take_recent_library_scan(first))
+            self.assertIs(take_recent_library_scan(second), second_scan)
+
+    def test_visible_media_entries_skip_hidden_and_report_folders(self):
+        with TemporaryDirectory() as tmpdir:
+            day_dir = os.path.join(tmpdir, "DCIM", "100APPLE")
+            os.makedirs(day_dir)
+            os.makedirs(os.path.join(tmpdir, ".hidden"))
+            for rel_path in (
+                os.path.join("DCIM", "100APPLE", "IMG_0001.HEIC"),
+                os.path.join("DCIM", "100APPLE", "._IMG_0001.HEIC"),
+                os.path.join("DCIM", "notes.txt"),
+                os.path.join(".hidden", "secret.jpg"),
+            ):
+                with open(os.path.join(tmpdir, rel_path), "wb") as fh:
+                    fh.write(b"12345")
+
+            folders = []
+            found = {
+                rel_path: entry.stat().st_size
+                for rel_path, entry in iter_visible_media_entries(tmpdir, folders)
+            }
+
+            self.assertEqual(found, {os.path.join("DCIM", "100APPLE", "IMG_0001.HEIC"): 5})
+            self.assertEqual(folders, ["DCIM", os.path.join("DCIM", "100APPLE")])
+
+
+class LibrarySyncEmptyFolderTest(unittest.TestCase):
+    def test_nested_empty_folders_are_removed_in_one_pass(self):
+        with TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, "2025", "2025-01-01", "nested"))
+            with open(os.path.join(tmpdir, "2025", "2025-01-01", ".DS_Store"), "wb") as fh:
+                fh.write(b"finder")
+            os.makedirs(os.path.join(tmpdir, ".thumbnails", "ab"))
+
+            conn = sqlite3.connect(":memory:")
+            conn.row_factory = sqlite3.Row
+            create_database_schema(conn.cursor())
+
+            events = list(synchronize_library_generator(tmpdir, conn, lambda path: None))
+            conn.close()
+
+            self.assertTrue(events[-1].startswith("event: complete"))
+            self.assertEqual(sorted(os.listdir(tmpdir)), [".thumbnails"])
+            self.assertTrue(os.path.isdir(os.path.join(tmpdir, ".thumbnails", "ab")))
+
+
+class LibrarySyncUntrackedFilesTest(unittest.TestCase):
+    def test_untracked_files_are_indexed_and_their_hashes_cached(self):
+        with TemporaryDirectory() as tmpdir:
+            day_dir = os.path.join(tmpdir, "2026", "2026-04-12")
+            os.makedirs(day_dir)
+            contents = {}
+            for index in range(40):
+                rel_path = os.path.join("2026", "2026-04-12", f"img_{index:02d}.jpg")
+                contents[rel_path] = f"photo {index}".encode()
+                with open(os.path.join(tmpdir, rel_path), "wb") as fh:
+                    fh.write(contents[rel_path])
+
+            conn = sqlite3.connect(":memory:")
+            conn.row_factory = sqlite3.Row
+            create_database_schema(conn.cursor())
+
+            with patch("library_sync.read_media_date", return_value="2026:04:12 09:30:15"):
+                events = list(
+                    synchronize_library_generator(tmpdir, conn, lambda path: (4, 3))
+                )
+
+            progress = [event for event in events if '"adding_untracked"' in event]
+            rows = {
+                row["current_path"]: row
+                for row in conn.execute(
+                    "SELECT current_path, content_hash, file_size, width FROM photos"
+                )
+            }
+            cached = conn.execute("SELECT COUNT(*) FROM hash_cache").fetchone()[0]
+            conn.close()
+
+            # Routine events are coalesced; the first and last always go out.
+            self.assertIn('"current":1,', progress[0])
+            self.assertIn('"current":40,', progress[-1])
+            self.assertEqual(set(rows), set(contents))
+            for rel_path, data in contents.items():
+                self.assertEqual(rows[rel_path]["content_hash"], hashlib.sha256(data).hexdigest())
+                self.assertEqual(rows[rel_path]["file_size"], len(data))
+                self.assertEqual(rows[rel_path]["width"], 4)
+            self.assertEqual(cached, 40)
+
+    def test_duplicate_content_is_not_reported_as_added_and_ghosts_are_removed(self):
+        with TemporaryDirectory() as tmpdir:
+            for name in ("a.jpg", "b.jpg", "c.jpg"):
+                with open(os.path.join(tmpdir, name), "wb") as fh:
+                    fh.write(b"same" if name != "c.jpg" else b"other")
+
+            conn = sqlite3.connect(":memory:")
+            conn.row_factory = sqlite3.Row
+            create_database_schema(conn.cursor())
+            conn.executemany(
+                "INSERT INTO photos (original_filename, current_path, content_hash, file_size, file_type)"
+                " VALUES (?, ?, ?, 1, 'photo')",
+                [(f"gone_{index}.jpg", f"gone_{index}.jpg", f"hash_{index}") for index in range(3)],
+            )
+
+            with patch("library_sync.read_media_date", return_value=None):
+                events = list(
+                    synchronize_library_generator(tmpdir, conn, lambda path: None)
+                )
+
+            paths = sorted(row[0] for row in conn.execute("SELECT current_path FROM photos"))
+            conn.close()
+
+            complete = events[-1]
+            self.assertIn('"untracked_files": ["a.jpg", "c.jpg"]', complete)
+            self.assertIn('"missing_files": 3', complete)
+            self.assertEqual(paths, ["a.jpg", "c.jpg"])
+
+    def test_catalog_path_load_is_an_ordered_covering_index_scan(self):
+        conn = sqlite3.connect(":memory:")
+        create_database_schema(conn.cursor())
+
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT current_path, id FROM photos ORDER BY current_path"
+            )
+        )
+        conn.close()
+
+        self.assertIn("USING COVERING INDEX", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_failed_batch_insert_retries_rows_and_skips_only_the_bad_one(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        create_database_schema(conn.cursor())
+        rows = [
+            {
+                "content_hash": f"hash-{name}",
+                "current_path": f"2026/2026-04-12/{name}.jpg",
+                "original_filename": f"{name}.jpg",
+                "date_taken": "2026:04:12 00:00:00",
+                "file_size": 1,
+                "file_type": "photo",
+                "width": 1,
+                "height": 1,
+            }
+            for name in ("a", "b", "c")
+        ]
+        # A value sqlite3 can't bind fails the executemany partway through.
+        rows[1]["width"] = object()
+
+        added = _insert_untracked_rows(conn, rows)
+        conn.commit()
+        stored = [row[0] for row in conn.execute("SELECT current_path FROM photos ORDER BY current_path")]
+        conn.close()
+
+        self.assertEqual(added, ["2026/2026-04-12/a.jpg", "2026/2026-04-12/c.jpg"])
+        self.assertEqual(stored, added)
+
+    def test_sorted_diff_splits_ghosts_and_untracked_paths(self):
+        disk_paths = ["2024/a.jpg", "2024/b.jpg", "2025/c.jpg", "2026/e.jpg"]
+        db_paths = ["2023/old.jpg", "2024/b.jpg", "2025/d.jpg", "2026/e.jpg", "2027/z.jpg"]
+
+        missing_indices, untracked_paths = _diff_sorted_paths(disk_paths, db_paths)
+
+        self.assertEqual(missing_indices, [0, 2, 4])
+        self.assertEqual(untracked_paths, ["2024/a.jpg", "2025/c.jpg"])
+
+
+class RebuildDatabaseRouteTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.library_path = os.path.join(self.tmpdir.name, "library")
+        self.db_path = os.path.join(self.library_path, ".library", "photo_library.db")
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self.original_paths = (
+            photo_app.LIBRARY_PATH,
+            photo_app.DB_PATH,
+            photo_app.THUMBNAIL_CACHE_DIR,
+            photo_app.TRASH_DIR,
+            photo_app.DB_BACKUP_DIR,
+            photo_app.IMPORT_TEMP_DIR,
+            photo_app.LOG_DIR,
+        )
+        photo_app.update_app_paths(self.library_path, self.db_path)
+        photo_app.app.config["TESTING"] = True
+        self.client = photo_app.app.test_client()
+
+    def tearDown(self):
+        (
+            photo_app.LIBRARY_PATH,
+            photo_app.DB_PATH,
+            photo_app.THUMBNAIL_CACHE_DIR,
+            photo_app.TRASH_DIR,
+            photo_app.DB_BACKUP_DIR,
+            photo_app.IMPORT_TEMP_DIR,
+            photo_app.LOG_DIR,
+        ) = self.original_paths
+        self.tmpdir.cleanup()
+
+    def test_rebuild_streams_worker_events_through_to_completion(self):
+        day_dir = os.path.join(self.library_path, "2026", "2026-04-12")
+        os.makedirs(day_dir)
+        with open(os.path.join(day_dir, "img_20260412_abcdef1.jpg"), "wb") as fh:
+            fh.write(b"photo")
+
+        with patch("library_sync.read_media_date", return_value="2026:04:12 09:30:15"):
+            response = self.client.get("/api/recovery/rebuild-database/execute")
+            body = response.get_data(as_text=True)
+
+        self.assertIn("event: progress", body)
+        self.assertTrue(body.rstrip().split("\n\n")[-1].startswith("event: complete"))
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM photos").fetchone()[0]
+        conn.close()
+        self.assertEqual(count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,18 +1,39 @@
 import os
 import subprocess
+import sys
 import unittest
+from datetime import datetime
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
+import media_dates
 from media_dates import (
     MediaDateVerificationError,
     UnsupportedMediaDateWrite,
+    format_canonical_media_date,
     metadata_write_policy,
+    parse_canonical_media_date,
+    read_embedded_media_date,
     write_and_verify_media_date,
     write_and_verify_video_date,
 )
 
 
+class CanonicalMediaDateTest(unittest.TestCase):
+    def test_parse_and_format_round_trip_canonical_strings(self):
+        for value in ("1900:01:01 00:00:00", "2024:02:29 23:59:59", "0999:12:31 08:05:09"):
+            with self.subTest(value=value):
+                parsed = parse_canonical_media_date(value)
+                self.assertEqual(parsed, datetime.strptime(value, "%Y:%m:%d %H:%M:%S"))
+                self.assertEqual(format_canonical_media_date(parsed), value)
+
+    def test_parse_rejects_invalid_dates_like_strptime(self):
+        for value in ("2023:02:29 00:00:00", "2024:13:01 00:00:00", "2024-01-01 00:00:00", "+024:01:01 00:00:00"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_canonical_media_date(value)
+
+
 class MediaDatePolicyTest(unittest.TestCase):
     def test_metadata_write_policy_marks_jpg_writable(self):
         policy = metadata_write_policy(".jpg")
@@ -130,5 +151,61 @@ class MediaDatePolicyTest(unittest.TestCase):
                 self.assertEqual(handle.read(), b"video-redated")
 
 
+FAKE_STAY_OPEN_EXIFTOOL = """\
+import json, os, sys
+args = []
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if line == "-execute":
+        with open(os.environ["FAKE_EXIFTOOL_LOG"], "a") as log:
+            log.write(str(os.getpid()) + "\\n")
+        print(json.dumps([{"DateTimeOriginal": "2021:02:03 04:05:06"}]))
+        print("{ready}", flush=True)
+        args = []
+    elif line == "False" and args[-1:] == ["-stay_open"]:
+        break
+    else:
+        args.append(line)
+"""
+
+
+class ExiftoolSessionTest(unittest.TestCase):
+    def setUp(self):
+        media_dates._close_idle_exiftool_sessions()
+        self._tmpdir = TemporaryDirectory()
+        bin_dir = os.path.join(self._tmpdir.name, "bin")
+        os.makedirs(bin_dir)
+        script = os.path.join(bin_dir, "exiftool")
+        with open(script, "w") as handle:
+            handle.write(f"#!{sys.executable}\n{FAKE_STAY_OPEN_EXIFTOOL}")
+        os.chmod(script, 0o755)
+        self.log_path = os.path.join(self._tmpdir.name, "calls.log")
+        env = patch.dict(
+            os.environ,
+            {
+                "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+                "FAKE_EXIFTOOL_LOG": self.log_path,
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        media_dates._close_idle_exiftool_sessions()
+        self._tmpdir.cleanup()
+
+    def test_photo_date_reads_reuse_one_exiftool_process(self):
+        for name in ("a.jpg", "b.heic", "c.png"):
+            self.assertEqual(
+                read_embedded_media_date(os.path.join(self._tmpdir.name, name)),
+                "2021:02:03 04:05:06",
+            )
+
+        with open(self.log_path) as handle:
+            pids = handle.read().split()
+        self.assertEqual(len(pids), 3)
+        self.assertEqual(len(set(pids)), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
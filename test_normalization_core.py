@@ -1,7 +1,10 @@
 import os
+import sqlite3
 import unittest
+from datetime import datetime
 from tempfile import TemporaryDirectory
 
+from db_schema import create_database_schema
 from library_cleanliness import build_canonical_photo_path
 from make_library_clean_v2 import _compute_photo_duplicate_key
 from normalization_contract import expected_canonical_rel_path_from_db_date
@@ -10,6 +13,7 @@ from normalization_core import (
     build_video_identity,
     duplicate_key_for_file,
     expected_canonical_rel_path,
+    normalize_ingest_video,
 )
 
 
@@ -47,6 +51,22 @@ class NormalizationCoreTest(unittest.TestCase):
             build_canonical_photo_path(date_taken, content_hash, ".JPG")[0],
         )
 
+    def test_canonical_path_matches_strftime_layout(self):
+        content_hash = "abc12345" + ("0" * 56)
+        for date_taken in ("1900:01:01 00:00:00", "2026:04:12 09:30:15", "2024:12:31 23:59:59"):
+            with self.subTest(date_taken=date_taken):
+                date_obj = datetime.strptime(date_taken, "%Y:%m:%d %H:%M:%S")
+                expected = os.path.join(
+                    date_obj.strftime("%Y"),
+                    date_obj.strftime("%Y-%m-%d"),
+                    f"img_{date_obj.strftime('%Y%m%d')}_abc12345.jpg",
+                )
+
+                self.assertEqual(build_canonical_photo_path(date_taken, content_hash, ".JPG")[0], expected)
+
+        with self.assertRaises(ValueError):
+            build_canonical_photo_path("2026:02:30 00:00:00", content_hash, ".JPG")
+
     def test_video_identity_uses_shared_duplicate_key_and_canonical_path(self):
         date_taken = "2026:04:12 00:00:00"
         content_hash = "def67890" + ("1" * 56)
@@ -84,6 +104,68 @@ class NormalizationCoreTest(unittest.TestCase):
             expected_canonical_rel_path(date_taken, content_hash, ".MOV"),
         )
 
+    def _ingest_video_capturing_finalize(self, write_video_metadata):
+        content_hash = "def67890" + ("1" * 56)
+        finalize_calls = []
+
+        def finalize(**kwargs):
+            finalize_calls.append(kwargs)
+            return type("Finalized", (), {"status": "updated"})()
+
+        with TemporaryDirectory() as tmpdir:
+            source_path = os.path.join(tmpdir, "clip.mov")
+            with open(source_path, "wb") as handle:
+                handle.write(b"video-bytes")
+            library_path = os.path.join(tmpdir, "library")
+            os.makedirs(library_path)
+
+            conn = sqlite3.connect(":memory:")
+            conn.row_factory = sqlite3.Row
+            create_database_schema(conn.cursor())
+            deps = NormalizationCoreDependencies(
+                library_path=library_path,
+                hash_cache=_HashCache(content_hash),
+                stage_photo_for_canonicalization=_unused,
+                cleanup_staged_file=lambda _path: None,
+                commit_staged_canonical_photo=_unused,
+                categorize_processing_error=lambda error: ("error", str(error)),
+                extract_exif_date=_unused,
+                write_video_metadata=write_video_metadata,
+                finalize_mutated_media=finalize,
+                compute_hash=_unused,
+                get_dimensions=_unused,
+                delete_thumbnail_for_hash=lambda _hash: None,
+            )
+
+            result = normalize_ingest_video(
+                conn,
+                source_path,
+                filename="clip.mov",
+                ext=".mov",
+                deps=deps,
+            )
+            conn.close()
+
+        self.assertEqual(result.status, "imported")
+        self.assertEqual(len(finalize_calls), 1)
+        return content_hash, finalize_calls[0]
+
+    def test_ingest_video_reuses_source_hash_when_metadata_write_is_noop(self):
+        content_hash, finalize_kwargs = self._ingest_video_capturing_finalize(
+            lambda _path, _date: None,
+        )
+
+        self.assertEqual(finalize_kwargs["precomputed_hash"], content_hash)
+
+    def test_ingest_video_rehashes_after_metadata_write_changes_file(self):
+        def write_metadata(path, _date):
+            with open(path, "ab") as handle:
+                handle.write(b"-dated")
+
+        _content_hash, finalize_kwargs = self._ingest_video_capturing_finalize(write_metadata)
+
+        self.assertIsNone(finalize_kwargs["precomputed_hash"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+import os
+import sqlite3
+import threading
+import unittest
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+from db_schema import create_database_schema
+from normalization_ingest import IngestDependencies, iter_ingest_events
+
+
+def _unused(*_args, **_kwargs):
+    raise AssertionError("unexpected dependency call")
+
+
+class IngestStagingTest(unittest.TestCase):
+    def _run_ingest(self, tmpdir, names, *, stop_after=None, fail_names=()):
+        library_path = os.path.join(tmpdir, "library")
+        staging_dir = os.path.join(tmpdir, "staging")
+        os.makedirs(library_path)
+        os.makedirs(staging_dir)
+
+        paths = []
+        for name in names:
+            path = os.path.join(tmpdir, name)
+            with open(path, "wb") as handle:
+                handle.write(name.encode())
+            paths.append(path)
+
+        stage_threads = set()
+        committed = []
+
+        def stage(source_path, *, temp_prefix):
+            stage_threads.add(threading.get_ident())
+            name = os.path.basename(source_path)
+            if name in fail_names:
+                raise RuntimeError(f"corrupt image {name}")
+            staged_path = os.path.join(staging_dir, temp_prefix + name)
+            with open(staged_path, "wb") as handle:
+                handle.write(b"staged")
+            return SimpleNamespace(
+                staged_path=staged_path,
+                canonical_photo=SimpleNamespace(
+                    content_hash=f"hash-{name}",
+                    relative_path=os.path.join("2026", name),
+                ),
+            )
+
+        def cleanup(staged_path):
+            if staged_path and os.path.exists(staged_path):
+                os.remove(staged_path)
+
+        def commit(conn, *, source_path, staged_photo, **_kwargs):
+            committed.append(os.path.basename(source_path))
+            cleanup(staged_photo.staged_path)
+            return len(committed), None
+
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        create_database_schema(conn.cursor())
+        deps = IngestDependencies(
+            library_path=library_path,
+            hash_cache=None,
+            stage_photo_for_canonicalization=stage,
+            cleanup_staged_file=cleanup,
+            commit_staged_canonical_photo=commit,
+            categorize_processing_error=lambda error: ("corrupted", str(error)),
+            extract_exif_date=_unused,
+            write_video_metadata=_unused,
+            finalize_mutated_media=_unused,
+            compute_hash=_unused,
+            get_dimensions=_unused,
+            delete_thumbnail_for_hash=lambda _hash: None,
+        )
+
+        events = list(iter_ingest_events(
+            conn,
+            paths,
+            deps,
+            stop_check=lambda: stop_after is not None and len(committed) >= stop_after,
+        ))
+        conn.close()
+        return events, committed, stage_threads, os.listdir(staging_dir)
+
+    def test_prestaged_photos_commit_in_request_order(self):
+        names = [f"photo_{index:02d}.jpg" for index in range(12)]
+        with TemporaryDirectory() as tmpdir:
+            events, committed, stage_threads, leftovers = self._run_ingest(
+                tmpdir,
+                names,
+                fail_names={"photo_03.jpg"},
+            )
+
+        self.assertEqual(committed, [name for name in names if name != "photo_03.jpg"])
+        self.assertNotIn(threading.get_ident(), stage_threads)
+        self.assertEqual(leftovers, [])
+        rejected = [payload for name, payload in events if name == "rejected"]
+        self.assertEqual([payload["file"] for payload in rejected], ["photo_03.jpg"])
+        self.assertEqual(events[-1][1]["imported"], len(names) - 1)
+
+    def test_stopping_early_removes_photos_staged_ahead(self):
+        names = [f"photo_{index:02d}.jpg" for index in range(12)]
+        with TemporaryDirectory() as tmpdir:
+            events, committed, _stage_threads, leftovers = self._run_ingest(
+                tmpdir,
+                names,
+                stop_after=2,
+            )
+
+        self.assertEqual(committed, names[:2])
+        self.assertEqual(leftovers, [])
+        self.assertNotIn("complete", [name for name, _payload in events])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
+import os
 import unittest
+from tempfile import TemporaryDirectory
 
 import app as photo_app
 
@@ -13,6 +15,40 @@ class ThumbnailEndpointTests(unittest.TestCase):
         self.assertEqual(status_code, 503)
         self.assertEqual(response.get_json()['error'], 'Library not configured')
 
+    def test_send_cached_thumbnail_serves_hit_and_reports_miss(self):
+        with TemporaryDirectory() as tmpdir:
+            cached_path = os.path.join(tmpdir, 'cached.jpg')
+            with open(cached_path, 'wb') as fh:
+                fh.write(b'thumb')
+
+            with photo_app.app.test_request_context():
+                hit = photo_app.send_cached_thumbnail(cached_path)
+                miss = photo_app.send_cached_thumbnail(os.path.join(tmpdir, 'missing.jpg'))
+                hit.direct_passthrough = False
+                self.assertEqual(hit.mimetype, 'image/jpeg')
+                self.assertEqual(hit.get_data(), b'thumb')
+                hit.close()
+
+            self.assertIsNone(miss)
+
+
+class ThumbnailShardCleanupTests(unittest.TestCase):
+    def test_empty_shards_are_removed_and_busy_shards_kept(self):
+        with TemporaryDirectory() as tmpdir:
+            emptied = os.path.join(tmpdir, 'ab', 'cd')
+            busy = os.path.join(tmpdir, 'ef', 'gh')
+            sibling = os.path.join(tmpdir, 'ef', 'ij')
+            for directory in (emptied, busy, sibling):
+                os.makedirs(directory)
+            with open(os.path.join(busy, 'efgh5678.jpg'), 'wb') as fh:
+                fh.write(b'thumb')
+
+            photo_app.cleanup_empty_thumbnail_folders(os.path.join(emptied, 'abcd1234.jpg'))
+            photo_app.cleanup_empty_thumbnail_folders(os.path.join(sibling, 'efij0000.jpg'))
+
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['ef'])
+            self.assertEqual(os.listdir(os.path.join(tmpdir, 'ef')), ['gh'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -94,6 +94,33 @@ class TrashViewTests(unittest.TestCase):
         self.assertTrue(os.path.isfile(trash_path))
         self.assertFalse(os.path.exists(os.path.join(self.library_path, "2024/2024-01-15/photo.jpg")))
 
+    def test_delete_removes_folders_left_without_media(self):
+        day_dir = os.path.join(self.library_path, "2024", "2024-01-15")
+        with open(os.path.join(day_dir, ".DS_Store"), "wb") as handle:
+            handle.write(b"finder")
+        with open(os.path.join(day_dir, "notes.txt"), "wb") as handle:
+            handle.write(b"sidecar")
+        kept_dir = os.path.join(self.library_path, "2024", "2024-02-01")
+        os.makedirs(kept_dir)
+        with open(os.path.join(kept_dir, "other.JPG"), "wb") as handle:
+            handle.write(b"other")
+
+        self.client.post("/api/photos/delete", json={"photo_ids": [1]})
+
+        self.assertFalse(os.path.exists(day_dir))
+        self.assertTrue(os.path.isfile(os.path.join(kept_dir, "other.JPG")))
+
+    def test_delete_batch_reports_missing_and_repeated_ids(self):
+        response = self.client.post(
+            "/api/photos/delete",
+            json={"photo_ids": [1, 99, 1]},
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertEqual(payload["deleted"], 1)
+        self.assertEqual(payload["total"], 3)
+        self.assertEqual(payload["errors"], ["Photo 99 not found", "Photo 1 not found"])
+
     def test_trash_grid_lists_deleted_photos_only(self):
         self.client.post("/api/photos/delete", json={"photo_ids": [1]})
         response = self.client.get("/api/trash/photos?limit=10&sort=newest")
@@ -124,6 +151,43 @@ class TrashViewTests(unittest.TestCase):
         self.assertEqual(deleted_count, 0)
         self.assertEqual(live_count, 1)
 
+    def test_restore_reports_ids_missing_from_trash(self):
+        self.client.post("/api/photos/delete", json={"photo_ids": [1]})
+        response = self.client.post("/api/photos/restore", json={"photo_ids": [1, 99]})
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertEqual(payload["restored"], 1)
+        self.assertEqual(payload["processed_ids"], [1])
+        self.assertEqual(payload["errors"], ["Photo 99 not found in trash"])
+
+    def test_restore_batch_reports_repeated_ids(self):
+        self.client.post("/api/photos/delete", json={"photo_ids": [1]})
+        response = self.client.post("/api/photos/restore", json={"photo_ids": [1, 1]})
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertEqual(payload["restored"], 1)
+        self.assertEqual(payload["processed_ids"], [1])
+        self.assertEqual(payload["errors"], ["Photo 1 not found in trash"])
+
+    def test_restore_with_missing_trash_file_releases_write_lock(self):
+        self.client.post("/api/photos/delete", json={"photo_ids": [1]})
+        conn = sqlite3.connect(self.db_path)
+        trash_filename = conn.execute(
+            "SELECT trash_filename FROM deleted_photos WHERE id = 1",
+        ).fetchone()[0]
+        conn.close()
+        os.remove(resolve_user_deleted_trash_path(photo_app.TRASH_DIR, trash_filename))
+
+        cursor = photo_app.get_db_connection().cursor()
+        try:
+            result = photo_app._restore_photo_ids(cursor, [1], photo_app.TRASH_DIR)
+            self.assertFalse(cursor.connection.in_transaction)
+        finally:
+            cursor.connection.close()
+
+        self.assertEqual(result[0], 0)
+        self.assertEqual(result[4], ["Photo 1 file not found in trash"])
+
     def test_restore_merges_when_live_copy_already_exists(self):
         self.client.post("/api/photos/delete", json={"photo_ids": [1]})
 
@@ -2,6 +2,7 @@ import hashlib
 import os
 import sqlite3
 import unittest
+from datetime import timedelta
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
@@ -274,6 +275,62 @@ class UpdatePhotoDateRouteTest(unittest.TestCase):
         self.assertEqual(row[1], content_hash)
         self.assertEqual(row[2], old_date)
 
+    def test_sequence_orders_by_original_date_and_spaces_by_interval(self):
+        late_id, _, _, _ = self._insert_photo(file_bytes=b"late", date_taken="2021:06:01 12:00:00")
+        early_id, _, _, _ = self._insert_photo(file_bytes=b"early", date_taken="2019:03:04 08:00:00")
+
+        conn = photo_app.get_db_connection()
+        try:
+            ordered_ids, undated_id = photo_app.order_photo_ids_by_edit_date(
+                conn.cursor(),
+                [late_id, 9999, early_id],
+            )
+        finally:
+            conn.close()
+
+        self.assertIsNone(undated_id)
+        self.assertEqual(ordered_ids, [early_id, late_id])
+        self.assertEqual(
+            photo_app.sequence_photo_dates(
+                ordered_ids,
+                "1969:12:31 23:59:00",
+                timedelta(minutes=5),
+            ),
+            {early_id: "1969:12:31 23:59:00", late_id: "1970:01:01 00:04:00"},
+        )
+
+    def test_sequence_dates_before_1970(self):
+        self.assertEqual(
+            photo_app.sequence_photo_dates(
+                [1, 2, 3],
+                "1901:02:28 23:00:00",
+                timedelta(hours=1),
+            ),
+            {1: "1901:02:28 23:00:00", 2: "1901:03:01 00:00:00", 3: "1901:03:01 01:00:00"},
+        )
+
+    def test_shift_moves_every_photo_by_first_photo_offset(self):
+        first_id, _, _, _ = self._insert_photo(file_bytes=b"first", date_taken="2021:06:01 12:00:00")
+        other_id, _, _, _ = self._insert_photo(file_bytes=b"other", date_taken="2019:03:04 08:00:00")
+
+        conn = photo_app.get_db_connection()
+        try:
+            shifted, error = photo_app.plan_shift_photo_dates(
+                conn.cursor(), [first_id, other_id], "2021:06:02 13:30:00",
+            )
+            _, missing_error = photo_app.plan_shift_photo_dates(
+                conn.cursor(), [9999, first_id], "2021:06:02 13:30:00",
+            )
+        finally:
+            conn.close()
+
+        self.assertIsNone(error)
+        self.assertEqual(
+            shifted,
+            {first_id: "2021:06:02 13:30:00", other_id: "2019:03:05 09:30:00"},
+        )
+        self.assertEqual(missing_error, ("First photo not found", 404))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,14 +4,15 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
 from collections import defaultdict
+from functools import lru_cache
 from typing import Callable, Literal, Optional, Tuple
 
 RestoreOutcome = Literal['restored', 'merged', 'error']
 TrashArchiveOutcome = Literal['archived', 'merged_duplicate']
 
-from library_filesystem import move_file_to_category_trash
+from library_filesystem import move_file, move_file_to_category_trash
+from photo_catalog import iter_rows_for_ids
 
 USER_DELETED_TRASH_CATEGORY = 'user_deleted'
 
@@ -162,23 +163,41 @@ def archive_live_photo_to_user_trash(
     return 'archived', trash_filename, None
 
 
+def fetch_deleted_rows_by_id(cursor, photo_ids) -> dict:
+    """Load ``deleted_photos`` rows for many ids in a few IN queries, keyed by id."""
+    return {
+        row['id']: row
+        for row in iter_rows_for_ids(
+            cursor,
+            "SELECT * FROM deleted_photos WHERE id IN ({placeholders})",
+            photo_ids,
+        )
+    }
+
+
 def restore_or_merge_deleted_photo(
     cursor,
     *,
     photo_id: int,
     trash_dir: str,
     library_path: str,
+    deleted_row=None,
 ) -> Tuple[RestoreOutcome, Optional[int], Optional[str]]:
     """
     Restore one deleted photo, or merge with a live library copy when the hash
     already exists in ``photos``.
 
+    Pass ``deleted_row`` when the caller already batch-loaded it with
+    ``fetch_deleted_rows_by_id``; otherwise the row is looked up here.
+
     Returns ``(outcome, live_photo_id, error_message)``.
     """
-    row = cursor.execute(
-        "SELECT * FROM deleted_photos WHERE id = ?",
-        (photo_id,),
-    ).fetchone()
+    row = deleted_row
+    if row is None:
+        row = cursor.execute(
+            "SELECT * FROM deleted_photos WHERE id = ?",
+            (photo_id,),
+        ).fetchone()
     if not row:
         return 'error', None, f'Photo {photo_id} not found in trash'
 
@@ -205,7 +224,7 @@ def restore_or_merge_deleted_photo(
         live_path = os.path.join(library_path, live_row['current_path'])
         if not os.path.exists(live_path):
             os.makedirs(os.path.dirname(live_path), exist_ok=True)
-            shutil.move(trash_path, live_path)
+            move_file(trash_path, live_path)
         else:
             os.remove(trash_path)
         cursor.execute("DELETE FROM deleted_photos WHERE id = ?", (photo_id,))
@@ -213,22 +232,32 @@ def restore_or_merge_deleted_photo(
         return 'merged', live_row['id'], None
 
     os.makedirs(os.path.dirname(full_path), exist_ok=True)
-    shutil.move(trash_path, full_path)
+    move_file(trash_path, full_path)
     if not os.path.exists(full_path):
         return 'error', None, f'Failed to verify restored file for photo {photo_id}'
 
-    columns = list(photo_data.keys())
-    placeholders = ', '.join(['?' for _ in columns])
-    values = [photo_data[col] for col in columns]
+    columns = tuple(photo_data.keys())
     cursor.execute(
-        f"INSERT INTO photos ({', '.join(columns)}) VALUES ({placeholders})",
-        values,
+        restored_photo_insert_sql(columns),
+        [photo_data[col] for col in columns],
     )
     cursor.execute("DELETE FROM deleted_photos WHERE id = ?", (photo_id,))
     cursor.connection.commit()
     return 'restored', photo_id, None
 
 
+@lru_cache(maxsize=32)
+def restored_photo_insert_sql(columns: Tuple[str, ...]) -> str:
+    """
+    INSERT statement for a restored photos row with the given column order.
+
+    Snapshots written by the same schema share one column tuple, so a bulk
+    restore formats (and sqlite3's statement cache prepares) one statement.
+    """
+    placeholders = ', '.join(['?'] * len(columns))
+    return f"INSERT INTO photos ({', '.join(columns)}) VALUES ({placeholders})"
+
+
 def resolve_user_deleted_trash_path(trash_dir: str, trash_filename: str) -> str:
     """Resolve on-disk path for a deleted photo, including legacy flat trash entries."""
     if not trash_filename:
@@ -422,12 +451,14 @@ def _hydrate_deleted_rows_by_id(cursor, id_rows):
     if not id_rows:
         return []
     ids = [row['id'] if hasattr(row, 'keys') else row[0] for row in id_rows]
-    placeholders = ','.join('?' * len(ids))
-    rows = cursor.execute(
-        f"{DELETED_PHOTO_GRID_SELECT} WHERE id IN ({placeholders})",
-        ids,
-    ).fetchall()
-    by_id = {row['id']: row for row in rows}
+    by_id = {
+        row['id']: row
+        for row in iter_rows_for_ids(
+            cursor,
+            DELETED_PHOTO_GRID_SELECT + " WHERE id IN ({placeholders})",
+            ids,
+        )
+    }
     return [by_id[photo_id] for photo_id in ids if photo_id in by_id]
 
 